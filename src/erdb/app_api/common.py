@@ -8,6 +8,7 @@ from typing import IO, Any, Generator, NamedTuple, Self
 
 from erdb.table import Table
 from erdb.loaders import GAME_VERSIONS
+from erdb.loaders.cache import SHARED as SHARED_CACHE
 from erdb.typing.game_version import GameVersion
 from erdb.typing.api_version import ApiVersion
 
@@ -27,6 +28,7 @@ class DataProxy(NamedTuple):
                     print(f"> {tb.title} [v{api}]", flush=True)
                     self.generate(api, game_version, tb)
 
+            print(f"Loader cache: {SHARED_CACHE.stats()}", flush=True)
             print(flush=True)
 
     def generate(self, api: ApiVersion, game_version: GameVersionEnum, table: Table) -> dict: # type: ignore
@@ -46,6 +48,7 @@ class DataProxy(NamedTuple):
 
         except FileNotFoundError:
             ver = GameVersion.from_string(game_version.value)
+            Table.compile_effects([table], ver)
             data = table.make_generator(ver).generate(api)
 
             with self._open_cache(api, game_version, table, mode="wb") as f:
@@ -1,11 +1,24 @@
+import os
+import json
+import hashlib
+import inspect
+from pathlib import Path
+from typing import Any, Callable
+
+from erdb import __version__
 import erdb.effect_parser.attribute_fields as attrib_fields
 import erdb.effect_parser.parsers as parse
 import erdb.effect_parser.hardcoded as hardcoded_effects
 from erdb.effect_parser.aggregator import aggregate_effects
+from erdb.effect_parser.compiled import CompiledEffects, CompiledRow
 from erdb.typing.models.effect import StatusEffects
-from erdb.typing.params import ParamRow, ParamDict
-from erdb.typing.enums import SpEffectType, AttackCondition
+from erdb.typing.params import ParamRow, ParamDict, param_source, sparse_fields
+from erdb.typing.enums import ItemIDFlag, SpEffectType, AttackCondition
 from erdb.typing.effects import SchemaEffect
+from erdb.typing.game_version import GameVersion
+from erdb.loaders import CACHE_PATH, write_cache_file
+from erdb.loaders.cache import LoaderCache, CacheStats, estimate_size
+from erdb.loaders.params import load as load_params, source as load_param_source
 
 
 _REFERENCE_EFFECT_PARAMS: list[str] = ["cycleOccurrenceSpEffectId", "applyIdOnGetSoul"]
@@ -30,42 +43,172 @@ _SP_EFFECT_TO_STR: dict[SpEffectType, str] = {
     SpEffectType.BLIGHT: "death_blight",
 }
 
-def get_effects(sp_effect: ParamRow, sp_effect_type: SpEffectType, triggeree: ParamRow | None = None, init_conditions: list[str] | None = None) -> list[SchemaEffect]:
+"""
+Resolved effects of SpEffects, which are referenced over and over by different
+affinities, armor pieces and items. Keyed by the rows themselves, which belong
+to the param of a single version, so entries are never shared between versions.
+Compiling effect tables resolves every SpEffect once and bypasses this cache.
+"""
+_RESOLVED = LoaderCache(int(os.getenv("ERDB_EFFECT_CACHE_MB", 64)) * 2**20)
+
+"""
+Attribute fields of every SpEffect which differ from their defaults, found in
+a single pass over the param's columns. Most fields of most SpEffects are left
+at their defaults, so resolving an effect visits only the few that are not.
+Entries keep their param alive, so that its ID cannot be reused by another,
+and the rows of the param are counted towards the entry's size.
+"""
+_NON_DEFAULT = LoaderCache(int(os.getenv("ERDB_EFFECT_FIELDS_CACHE_MB", 16)) * 2**20)
+
+"""
+Added conditions effects are compiled for, every condition `parse_effects` is called with.
+"""
+_COMPILED_CONDITIONS: list[AttackCondition | None] = [None, AttackCondition.ON_HIT]
+
+"""
+Compiled effect tables of the params SpEffects are resolved from, or None if
+there is none. Like `_NON_DEFAULT`, entries keep their param alive and count it.
+"""
+_COMPILED = LoaderCache(int(os.getenv("ERDB_COMPILED_EFFECTS_CACHE_MB", 16)) * 2**20)
+
+"""
+Identifies the code effects are resolved by. Compiled tables are reused only
+while both the erdb version and the sources of the effect parser, including
+the hardcoded effects, are unchanged.
+"""
+_RESOLVER: dict[str, str] = {
+    "erdb": __version__,
+    "sources": hashlib.sha256(b"".join(
+        path.read_bytes() for path in sorted([*Path(__file__).parent.glob("*.py"), Path(inspect.getfile(SchemaEffect))])
+    )).hexdigest(),
+}
+
+def resolution_stats() -> CacheStats:
+    return _RESOLVED.stats()
+
+def _entry_size(entry: tuple[ParamDict, Any]) -> int:
+    return estimate_size(entry[0]) + estimate_size(entry[1])
+
+def _find_non_default_fields(sp_effects: ParamDict) -> dict[int, tuple[str, ...]]:
+    defaults = {field: str(attrib_field.default_value) for field, attrib_field in attrib_fields.get().items()}
+    tests = {field: (lambda value, default=default: value != default) for field, default in defaults.items()}
+    return sparse_fields(sp_effects, tests)
+
+def _non_default_fields(sp_effects: ParamDict) -> dict[int, tuple[str, ...]]:
+    return _NON_DEFAULT.get(id(sp_effects), lambda: (sp_effects, _find_non_default_fields(sp_effects)), sizeof=_entry_size)[1]
+
+def get_effects(sp_effect: ParamRow, sp_effect_type: SpEffectType, triggeree: ParamRow | None = None, init_conditions: list[str] | None = None,
+                fields: tuple[str, ...] | None = None) -> tuple[SchemaEffect, ...]:
+    """
+    Resolve effects of a single SpEffect. The result is shared between callers and must not be modified.
+    `fields` are the attribute fields of the SpEffect which differ from their defaults, if known.
+    """
+    key = (sp_effect, sp_effect_type, triggeree, None if init_conditions is None else tuple(init_conditions))
+    return _RESOLVED.get(key, lambda: _resolve_effects(sp_effect, sp_effect_type, triggeree, init_conditions, fields))
+
+def _resolve_effects(sp_effect: ParamRow, sp_effect_type: SpEffectType, triggeree: ParamRow | None = None, init_conditions: list[str] | None = None,
+                     fields: tuple[str, ...] | None = None) -> tuple[SchemaEffect, ...]:
     effects = hardcoded_effects.get(sp_effect.index, sp_effect_type)
+    attributes = attrib_fields.get()
 
-    for field, attrib_field in attrib_fields.get().items():
-        if sp_effect[field] == str(attrib_field.default_value):
-            continue
+    if fields is None:
+        fields = tuple(field for field, attrib_field in attributes.items() if sp_effect[field] != str(attrib_field.default_value))
 
+    for field in fields:
+        attrib_field = attributes[field]
         effect = SchemaEffect.from_attribute_field(sp_effect[field].as_float, attrib_field)
 
-        effect.conditions = init_conditions
+        conditions = init_conditions
         if conds := parse.conditions(sp_effect, triggeree):
-            effect.conditions = conds if effect.conditions is None else effect.conditions + conds
+            conditions = conds if conditions is None else conditions + conds
 
-        effect.tick_interval = parse.interval(sp_effect)
-        effect.value_pvp = parse.value_pvp(sp_effect, field, attrib_fields.get())
+        effects.append(effect.replace(
+            conditions=conditions,
+            tick_interval=parse.interval(sp_effect),
+            value_pvp=parse.value_pvp(sp_effect, field, attrib_fields.get())))
 
-        effects.append(effect)
-
-    return effects
+    return tuple(effects)
 
 def get_effects_nested(sp_effect: ParamRow, sp_effects: ParamDict, add_condition: AttackCondition | None) -> list[SchemaEffect]:
+    return _resolve_nested(sp_effect, sp_effects, add_condition, _non_default_fields(sp_effects), get_effects)
+
+def _resolve_nested(sp_effect: ParamRow, sp_effects: ParamDict, add_condition: AttackCondition | None,
+                    non_default: dict[int, tuple[str, ...]], resolve: Callable[..., tuple[SchemaEffect, ...]]) -> list[SchemaEffect]:
+    def fields(row: ParamRow) -> tuple[str, ...] | None:
+        return non_default.get(row.index, ()) if sp_effects.get(row.index) is row else None
+
     sp_effect_type = SpEffectType(sp_effect["stateInfo"])
-    effects = get_effects(sp_effect, sp_effect_type, init_conditions=[str(add_condition)] if add_condition else None)
+    effects = list(resolve(sp_effect, sp_effect_type, init_conditions=[str(add_condition)] if add_condition else None, fields=fields(sp_effect)))
 
     for ref_id in (sp_effect[ref_field].as_int for ref_field in _REFERENCE_EFFECT_PARAMS):
         if ref_sp_effect := sp_effects.get(ref_id):
             if ref_sp_effect.index > 0:
-                effects += get_effects(ref_sp_effect, sp_effect_type, sp_effect)
+                effects += resolve(ref_sp_effect, sp_effect_type, sp_effect, fields=fields(ref_sp_effect))
 
     for condition_offset in hardcoded_effects.get_conditions(sp_effect.index):
         ref_sp_effect = sp_effects[sp_effect.index + condition_offset.offset]
         init_conditions = None if condition_offset.condition is None else [str(condition_offset.condition)]
-        effects += get_effects(ref_sp_effect, sp_effect_type, sp_effect, init_conditions)
+        effects += resolve(ref_sp_effect, sp_effect_type, sp_effect, init_conditions, fields(ref_sp_effect))
 
     return effects
 
+def _table_source(source: Any) -> dict[str, Any]:
+    return {"param": source, **_RESOLVER}
+
+def _compiled_path(source: dict[str, Any]) -> Path:
+    # named after the source, versions with an identical param share the table
+    digest = hashlib.sha256(json.dumps(source).encode("utf-8")).hexdigest()
+    return CACHE_PATH / "effects" / f"{digest}.eff"
+
+def _compile_row(sp_effect: ParamRow, sp_effects: ParamDict, non_default: dict[int, tuple[str, ...]]) -> CompiledRow:
+    references = [i for i in (sp_effect[ref_field].as_int for ref_field in _REFERENCE_EFFECT_PARAMS) if i > 0 and i in sp_effects]
+    references += [i for i in (sp_effect.index + c.offset for c in hardcoded_effects.get_conditions(sp_effect.index)) if i in sp_effects]
+
+    try:
+        effects = [_resolve_nested(sp_effect, sp_effects, condition, non_default, _resolve_effects) for condition in _COMPILED_CONDITIONS]
+
+    except (KeyError, ValueError):
+        return CompiledRow(sp_effect.index, references, None)
+
+    return CompiledRow(sp_effect.index, references, effects)
+
+def compile_version(version: GameVersion, force: bool = False) -> int | None:
+    """
+    Resolve effects of every SpEffect of a version into a compiled table, unless
+    an up-to-date one already exists. Returns the number of SpEffects in the
+    table, or None if the param has no source.
+    """
+    if (source := load_param_source("SpEffectParam", version)) is None:
+        return None
+
+    source = _table_source(source)
+    path = _compiled_path(source)
+
+    # only the header is read, the table is decoded once looked up during generation
+    if not force and (row_count := CompiledEffects.peek(path, source)) is not None:
+        return row_count
+
+    # every SpEffect is resolved once here, none of it is worth caching
+    sp_effects = load_params("SpEffectParam", version, ItemIDFlag.NON_EQUIPABBLE)
+    non_default = _find_non_default_fields(sp_effects)
+    data = CompiledEffects.compile((_compile_row(row, sp_effects, non_default) for row in sp_effects.values()), _COMPILED_CONDITIONS, source)
+    write_cache_file(path, data)
+
+    # params looked up before have to find the new table
+    _COMPILED.clear()
+
+    return len(sp_effects)
+
+def _compiled_effects(sp_effects: ParamDict) -> CompiledEffects | None:
+    def build() -> tuple[ParamDict, CompiledEffects | None]:
+        if (source := param_source(sp_effects)) is None:
+            return sp_effects, None
+
+        source = _table_source(source)
+        return sp_effects, CompiledEffects.open(_compiled_path(source), source)
+
+    return _COMPILED.get(id(sp_effects), build, sizeof=_entry_size)[1]
+
 def get_status_effect(sp_effect: ParamRow) -> tuple[str, int]:
     # NOTE: not identifying effects by values, relying on `stateInfo` to be correct at all times
     etype = SpEffectType(sp_effect["stateInfo"])
@@ -73,20 +216,26 @@ def get_status_effect(sp_effect: ParamRow) -> tuple[str, int]:
 
 def parse_effects(row: ParamRow, sp_effects: ParamDict, *effect_referencing_fields: str, add_condition: AttackCondition | None = None) -> list[dict]:
     effects: list[SchemaEffect] = []
+    compiled = _compiled_effects(sp_effects)
 
     for effect_id in (row[ref_field].as_int for ref_field in effect_referencing_fields):
-        if effect_id in hardcoded_effects.get_status_effect_ranges():
+        if effect_id in hardcoded_effects.get_status_effect_ids():
             continue
 
-        if effect_id in sp_effects:
-            effects += get_effects_nested(sp_effects[effect_id], sp_effects, add_condition)
+        if effect_id not in sp_effects:
+            continue
+
+        if compiled is None or (resolved := compiled.get(sp_effects[effect_id], sp_effects, add_condition)) is None:
+            resolved = get_effects_nested(sp_effects[effect_id], sp_effects, add_condition)
+
+        effects += resolved
 
     return [e.to_dict() for e in aggregate_effects(effects)]
 
 def parse_status_effects(effect_ids: list[int], sp_effects: ParamDict) -> StatusEffects:
     # Getting 0th effect if value no found, bug with Antspur Rapier -- get anything to return a 0 status effect
     effects = [sp_effects.get(i, sp_effects[0]) for i in effect_ids if i != -1]
-    status_effects = hardcoded_effects.get_status_effect_ranges()
+    status_effects = hardcoded_effects.get_status_effect_ids()
     return StatusEffects(**dict([get_status_effect(e) for e in effects if e.index in status_effects]))
 
 def parse_weapon_effects(weapon: ParamRow) -> list[dict]:
@@ -0,0 +1,158 @@
+"""
+Compiled table of the resolved effects of every SpEffect of a param.
+
+Resolution of every row is stored for each of a fixed set of added conditions,
+along with the IDs of SpEffects the resolution referenced. Params which lack
+any of these (partial ranges of the param) or rows whose resolution failed
+are not answered from the table, so they are resolved as usual instead.
+The source identifies both the param and the code which resolved it.
+
+Identical effects are stored once and rows refer to them by their position.
+Layout: preamble (magic, format version, header length), JSON header with the
+source, conditions and row count, followed by a zlib-compressed JSON body.
+"""
+
+import sys
+import json
+import zlib
+import struct
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple, Self
+
+from erdb.typing.params import ParamRow, ParamDict
+from erdb.typing.effects import AttributeName, EffectModel, EffectType, SchemaEffect
+
+
+_MAGIC = b"ERDBEFF\0"
+_FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<8sII")
+
+class CompiledRow(NamedTuple):
+    index: int
+    references: list[int]
+    effects: list[list[SchemaEffect]] | None # per condition, None if resolution failed
+
+def _encode(effect: SchemaEffect) -> list:
+    return [
+        effect.attribute.value, effect.effect_model.value, effect.effect_type.value, effect.value,
+        effect.value_pvp, effect.tick_interval, None if effect.conditions is None else list(effect.conditions),
+    ]
+
+def _decode(entry: list) -> SchemaEffect:
+    attribute, model, effect_type, value, value_pvp, tick_interval, conditions = entry
+    return SchemaEffect(
+        attribute=AttributeName(attribute), effect_model=EffectModel(model), effect_type=EffectType(effect_type),
+        value=value, value_pvp=value_pvp, tick_interval=tick_interval, conditions=conditions)
+
+def _header_length(preamble: bytes) -> int:
+    magic, version, header_length = _PREAMBLE.unpack(preamble)
+
+    if magic != _MAGIC or version != _FORMAT_VERSION:
+        raise ValueError("Not a compiled effect table or unsupported format version")
+
+    return header_length
+
+class CompiledEffects(object):
+    source: Any
+    conditions: list[str | None]
+    row_count: int
+
+    _effects: list[SchemaEffect]
+    _rows: dict[int, tuple[list[int], list[list[int]]]]
+    _failed: set[int]
+
+    def __init__(self, buffer: bytes) -> None:
+        header_length = _header_length(buffer[:_PREAMBLE.size])
+        meta = json.loads(buffer[_PREAMBLE.size:_PREAMBLE.size + header_length])
+        body = json.loads(zlib.decompress(buffer[_PREAMBLE.size + header_length:]))
+
+        self.source = meta["source"]
+        self.conditions = meta["conditions"]
+        self.row_count = meta["row_count"]
+
+        self._effects = [_decode(entry) for entry in body["effects"]]
+        self._rows = {int(index): (refs, variants) for index, (refs, variants) in body["rows"].items()}
+        self._failed = set(body["failed"])
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sum(sys.getsizeof(v) for v in [self._effects, self._rows, self._failed]) \
+             + sum(sys.getsizeof(e) for e in self._effects) + sum(sys.getsizeof(r) for r in self._rows.values())
+
+    def get(self, sp_effect: ParamRow, sp_effects: ParamDict, condition: str | None) -> list[SchemaEffect] | None:
+        """
+        Resolved effects of a SpEffect, or None if they have to be resolved from the param.
+        Effects are shared between callers and must not be modified.
+        """
+        if condition not in self.conditions or sp_effect.index in self._failed:
+            return None
+
+        if (entry := self._rows.get(sp_effect.index)) is None:
+            return []
+
+        references, variants = entry
+
+        if not all(ref in sp_effects for ref in references):
+            return None
+
+        return [self._effects[i] for i in variants[self.conditions.index(condition)]]
+
+    @classmethod
+    def compile(cls, rows: Iterable[CompiledRow], conditions: list[str | None], source: Any) -> bytes:
+        effects: dict[str, int] = dict()
+        compiled_rows: dict[int, tuple[list[int], list[list[int]]]] = dict()
+        failed: list[int] = []
+        row_count = 0
+
+        def effect_id(effect: SchemaEffect) -> int:
+            # keyed by the text, so that 1 and 1.0 are kept apart
+            return effects.setdefault(json.dumps(_encode(effect)), len(effects))
+
+        for row in rows:
+            row_count += 1
+
+            if row.effects is None:
+                failed.append(row.index)
+
+            elif len(row.references) > 0 or any(len(variant) > 0 for variant in row.effects):
+                compiled_rows[row.index] = (row.references, [[effect_id(e) for e in variant] for variant in row.effects])
+
+        body = {
+            "effects": [json.loads(text) for text in effects.keys()],
+            "rows": compiled_rows,
+            "failed": failed,
+        }
+
+        meta = json.dumps({"source": source, "conditions": conditions, "row_count": row_count}).encode("utf-8")
+        preamble = _PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, len(meta))
+
+        return preamble + meta + zlib.compress(json.dumps(body, separators=(",", ":")).encode("utf-8"), level=9)
+
+    @classmethod
+    def open(cls, path: Path, source: Any) -> Self | None:
+        """
+        Read a compiled effect table, or return None if it is missing, invalid
+        or was compiled from a different source.
+        """
+        try:
+            with open(path, mode="rb") as f:
+                table = cls(f.read())
+
+        except (OSError, ValueError, struct.error, zlib.error):
+            return None
+
+        return table if table.source == source else None
+
+    @classmethod
+    def peek(cls, path: Path, source: Any) -> int | None:
+        """
+        Row count of a compiled effect table read from its header alone, or None
+        if it is missing, invalid or was compiled from a different source.
+        """
+        try:
+            with open(path, mode="rb") as f:
+                meta = json.loads(f.read(_header_length(f.read(_PREAMBLE.size))))
+
+        except (OSError, ValueError, struct.error):
+            return None
+
+        return meta.get("row_count") if isinstance(meta, dict) and meta.get("source") == source else None
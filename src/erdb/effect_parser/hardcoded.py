@@ -175,5 +175,13 @@ def get(index: int, sp_effect_type) -> List[SchemaEffect]:
 def get_conditions(index: int) -> List[SpEffectConditionOffset]:
     return _FROM_OFFSET.get(index, [])
 
-def get_status_effect_ranges() -> SpEffectRanges:
-    return SpEffectRanges.construct((6400, 6810), (105000, 109000))
\ No newline at end of file
+_STATUS_EFFECT_RANGES = SpEffectRanges.construct((6400, 6810), (105000, 109000))
+
+"""
+Every ID within the status effect ranges, checking membership of a single ID
+is a hash lookup instead of a comparison against each range.
+"""
+_STATUS_EFFECT_IDS = frozenset(i for r in _STATUS_EFFECT_RANGES.ranges for i in range(r.begin, r.end + 1))
+
+def get_status_effect_ids() -> frozenset[int]:
+    return _STATUS_EFFECT_IDS
\ No newline at end of file
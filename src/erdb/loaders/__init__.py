@@ -1,12 +1,51 @@
+import os
 import importlib.resources
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 
 from erdb.typing.game_version import GameVersion
 
 
 TOP_LEVEL_PKG = __name__.split(".")[0]
 PKG_DATA_PATH = Path(str(importlib.resources.files(TOP_LEVEL_PKG))) / "data"
+CACHE_PATH = Path(os.getenv("ERDB_CACHE_DIR", Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "erdb"))
+GAMEDATA_PATH = PKG_DATA_PATH / "gamedata"
 GAME_VERSIONS = sorted(
-    [GameVersion.from_string(p.stem) for p in (PKG_DATA_PATH / "gamedata").glob("*zip")],
+    # zip archives or manifests of the content-addressed store, see `erdb.loaders.archives`
+    [GameVersion.from_string(stem) for stem in {p.stem for p in [*GAMEDATA_PATH.glob("*.zip"), *(GAMEDATA_PATH / "versions").glob("*.json")]}],
     reverse=True
-)
\ No newline at end of file
+)
+
+def write_file(path: Path, data: bytes):
+    """
+    Atomically write a file through a temporary one next to it, so that readers
+    never observe a partial file and an interrupted write leaves none behind.
+    """
+    temp_name: str | None = None
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as f:
+            temp_name = f.name
+            f.write(data)
+
+        os.replace(temp_name, path)
+
+    except BaseException:
+        if temp_name is not None:
+            Path(temp_name).unlink(missing_ok=True)
+        raise
+
+def write_cache_file(path: Path, data: bytes) -> bool:
+    """
+    Atomically write compiled data to the cache, so concurrent readers never
+    observe a partial file. Returns False if the cache location is not writable,
+    in which case callers are expected to keep using the in-memory data.
+    """
+    try:
+        write_file(path, data)
+        return True
+
+    except OSError:
+        return False
@@ -0,0 +1,219 @@
+import io
+import os
+import json
+import zlib
+import hashlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterable, Protocol
+from zipfile import ZipFile
+
+from erdb.loaders import GAMEDATA_PATH, write_file
+from erdb.loaders.cache import LoaderCache
+from erdb.typing.game_version import GameVersion
+
+
+STORE_VERSIONS_PATH = GAMEDATA_PATH / "versions"
+STORE_BLOBS_PATH = GAMEDATA_PATH / "blobs"
+
+def _file_source(path: Path) -> list:
+    stat = path.stat()
+    return [path.name, stat.st_size, stat.st_mtime_ns]
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+class GamedataArchive(Protocol):
+    version: GameVersion
+    source: list # identifies the file backing the archive, changes whenever it is replaced
+
+    def __contains__(self, __x: object) -> bool:
+        ...
+
+    def members(self) -> list[str]:
+        ...
+
+    def digest(self, member: str) -> str:
+        """
+        Content hash of a member, equal for identical members of different versions.
+        """
+        ...
+
+    def member_source(self, member: str) -> Any:
+        """
+        Cheapest value which changes whenever the member's contents do,
+        suitable for invalidating data compiled from the member.
+        """
+        ...
+
+    def read(self, member: str) -> bytes:
+        ...
+
+    def open(self, member: str) -> io.BytesIO:
+        ...
+
+    def close(self):
+        ...
+
+class _ArchiveBase(ABC):
+    _bytes: LoaderCache | None
+    _lock: Lock
+
+    def __init__(self, byte_budget: int) -> None:
+        self._bytes = LoaderCache(byte_budget) if byte_budget > 0 else None
+        self._lock = Lock()
+
+    @abstractmethod
+    def _read_member(self, member: str) -> bytes:
+        ...
+
+    def read(self, member: str) -> bytes:
+        def read_member() -> bytes:
+            with self._lock:
+                return self._read_member(member)
+
+        if self._bytes is None:
+            return read_member()
+
+        return self._bytes.get(member, read_member, sizeof=len)
+
+    def open(self, member: str) -> io.BytesIO:
+        return io.BytesIO(self.read(member))
+
+"""
+Gamedata archive stored as a single zip file, as produced by older sourcing.
+The central directory is read once and kept open for the lifetime of the process.
+"""
+class ZipArchive(_ArchiveBase):
+    version: GameVersion
+    source: list
+
+    _zip: ZipFile
+    _members: set[str]
+    _digests: dict[str, str]
+
+    def __init__(self, version: GameVersion, path: Path, byte_budget: int = 0) -> None:
+        super().__init__(byte_budget)
+        self.version = version
+        self.source = _file_source(path)
+        self._zip = ZipFile(path, mode="r")
+        self._members = set(self._zip.namelist())
+        self._digests = dict()
+
+    def __contains__(self, __x: object) -> bool:
+        return __x in self._members
+
+    def members(self) -> list[str]:
+        return self._zip.namelist()
+
+    def digest(self, member: str) -> str:
+        if (digest := self._digests.get(member)) is None:
+            digest = self._digests[member] = _digest(self.read(member))
+        return digest
+
+    def member_source(self, member: str) -> Any:
+        return self.source
+
+    def _read_member(self, member: str) -> bytes:
+        return self._zip.read(member)
+
+    def close(self):
+        self._zip.close()
+
+"""
+Gamedata archive resolved through the content-addressed store. Every unique
+member is stored once as a zlib-compressed blob named by the SHA-256 of its
+contents, and a version is a manifest mapping member names to those hashes.
+"""
+class StoredArchive(_ArchiveBase):
+    version: GameVersion
+    source: list
+
+    _manifest: dict[str, str]
+
+    def __init__(self, version: GameVersion, path: Path, byte_budget: int = 0) -> None:
+        super().__init__(byte_budget)
+        self.version = version
+        self.source = _file_source(path)
+
+        with open(path, mode="r", encoding="utf-8") as f:
+            self._manifest = json.load(f)["members"]
+
+    def __contains__(self, __x: object) -> bool:
+        return __x in self._manifest
+
+    def members(self) -> list[str]:
+        return list(self._manifest.keys())
+
+    def digest(self, member: str) -> str:
+        return self._manifest[member]
+
+    def member_source(self, member: str) -> Any:
+        return self._manifest[member]
+
+    def _read_member(self, member: str) -> bytes:
+        with open(STORE_BLOBS_PATH / self._manifest[member], mode="rb") as f:
+            return zlib.decompress(f.read())
+
+    def close(self):
+        pass
+
+def write_version(version: GameVersion, members: Iterable[tuple[str, bytes]]):
+    """
+    Add a version to the content-addressed store, writing only the blobs
+    which are not already stored for another version. Files are written
+    atomically, so an interrupted write never leaves a partial blob behind
+    to be reused, and the manifest is written last.
+    """
+    manifest = STORE_VERSIONS_PATH / f"{version}.json"
+    assert not manifest.exists(), f"{manifest} already exists."
+
+    STORE_BLOBS_PATH.mkdir(parents=True, exist_ok=True)
+    STORE_VERSIONS_PATH.mkdir(parents=True, exist_ok=True)
+
+    digests: dict[str, str] = dict()
+
+    for name, data in members:
+        digest = digests[name] = _digest(data)
+
+        if not (blob := STORE_BLOBS_PATH / digest).exists():
+            write_file(blob, zlib.compress(data, level=9))
+
+    write_file(manifest, (json.dumps({"members": dict(sorted(digests.items()))}, indent=4) + "\n").encode("utf-8"))
+
+_pool: dict[str, GamedataArchive] = dict()
+_pool_lock = Lock()
+
+def _locate(version: GameVersion) -> tuple[type[ZipArchive] | type[StoredArchive], Path]:
+    if (manifest := STORE_VERSIONS_PATH / f"{version}.json").exists():
+        return StoredArchive, manifest
+
+    return ZipArchive, GAMEDATA_PATH / f"{version}.zip"
+
+def get(version: GameVersion) -> GamedataArchive:
+    """
+    Retrieve the pooled archive of a game version, reopening it if the file
+    was replaced since it was opened. Versions in the content-addressed store
+    take precedence over zip archives.
+    """
+    cls, path = _locate(version)
+    source = _file_source(path)
+
+    with _pool_lock:
+        archive = _pool.get(str(version))
+
+        if archive is None or not isinstance(archive, cls) or archive.source != source:
+            if archive is not None:
+                archive.close()
+
+            archive = _pool[str(version)] = cls(version, path, int(os.getenv("ERDB_ARCHIVE_CACHE_MB", 0)) * 2**20)
+
+        return archive
+
+def changed_members(old: GameVersion, new: GameVersion) -> list[str]:
+    """
+    Members added in or modified by `new` when compared to `old`.
+    """
+    old_archive, new_archive = get(old), get(new)
+    return [m for m in new_archive.members() if m not in old_archive or old_archive.digest(m) != new_archive.digest(m)]
@@ -0,0 +1,120 @@
+import os
+import sys
+from collections import OrderedDict
+from threading import Lock, RLock
+from typing import Any, Callable, Hashable, NamedTuple, TypeVar
+
+
+T = TypeVar("T")
+
+_DEFAULT_BUDGET_MB = 1024
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate memory footprint of a loaded param or msg dictionary. Containers
+    are measured one level deep, nested objects are expected to account for
+    their own contents via `__sizeof__`.
+    """
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sys.getsizeof(v) for v in value.values())
+
+    return sys.getsizeof(value)
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+    budget: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return 0.0 if total == 0 else self.hits / total
+
+    def __str__(self) -> str:
+        mb = lambda b: f"{b / 2**20:.1f} MiB"
+        return f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.0%} hit rate), " \
+               f"{self.evictions} evictions, {self.entries} entries using {mb(self.size)} of {mb(self.budget)}"
+
+"""
+Process-wide LRU cache of loaded gamedata, shared by every table spec and generator.
+Values must be treated as read-only, since the same instance is handed to every caller.
+Loaders run outside of the cache's lock, so that a slow load does not block other
+threads, while each key has a lock of its own for only one thread to load it.
+"""
+class LoaderCache(object):
+    budget: int
+
+    _entries: OrderedDict[Hashable, tuple[Any, int]]
+    _size: int
+    _hits: int
+    _misses: int
+    _evictions: int
+    _lock: RLock
+    _loading: dict[Hashable, Lock]
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self._entries = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = RLock()
+        self._loading = dict()
+
+    def get(self, key: Hashable, loader: Callable[[], T], sizeof: Callable[[T], int] = estimate_size) -> T:
+        with self._lock:
+            if (entry := self._lookup(key)) is not None:
+                return entry[0]
+
+            key_lock = self._loading.setdefault(key, Lock())
+
+        with key_lock:
+            with self._lock:
+                # loaded by another thread while waiting for the key
+                if (entry := self._lookup(key)) is not None:
+                    return entry[0]
+
+                self._misses += 1
+
+            try:
+                value = loader()
+                size = sizeof(value)
+
+                with self._lock:
+                    self._entries[key] = (value, size)
+                    self._size += size
+                    self._evict()
+
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+
+            return value
+
+    def _lookup(self, key: Hashable) -> tuple[Any, int] | None:
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return entry
+
+    def _evict(self):
+        # always keep the most recent entry, even if it exceeds the budget alone
+        while self._size > self.budget and len(self._entries) > 1:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size -= size
+            self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._size, self.budget)
+
+SHARED = LoaderCache(int(os.getenv("ERDB_CACHE_BUDGET_MB", _DEFAULT_BUDGET_MB)) * 2**20)
@@ -0,0 +1,335 @@
+"""
+Compiled, column-oriented representation of a param CSV.
+
+Every column is dictionary-encoded: each unique cell value is stored once and
+rows hold an array-backed code into the column's value table. The file is
+memory-mapped, so opening it is near-instant and only the value tables of the
+columns which are actually accessed are ever decoded.
+
+Column types are inferred during compilation. Integer and float columns store
+their values already decoded, and decoding a column yields shared `ParamField`
+instances with their numeric conversions pre-populated.
+
+Params with integer Row IDs also carry an index of the IDs in sorted order,
+so that rows within an ID range are found without scanning the whole param.
+
+Layout: preamble (magic, format version, header length), JSON header with
+column offsets, followed by 8-byte aligned value tables, code arrays and the
+Row ID index.
+"""
+
+import sys
+import json
+import mmap
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Self
+
+from erdb.typing.params import ParamField
+
+
+_MAGIC = b"ERDBCOL\0"
+_FORMAT_VERSION = 3
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 8
+
+def _code_typecode(value_count: int) -> str:
+    return "B" if value_count <= 0xFF else "H" if value_count <= 0xFFFF else "I"
+
+def _padding(offset: int) -> bytes:
+    return b"\0" * (-offset % _ALIGNMENT)
+
+def _is_int(value: str | None) -> bool:
+    try:
+        return value is not None and str(int(value)) == value
+    except ValueError:
+        return False
+
+def _is_float(value: str | None) -> bool:
+    try:
+        return value is not None and float(value) is not None
+    except ValueError:
+        return False
+
+def _infer_type(values: list[str | None]) -> str:
+    """
+    Integer columns must round-trip exactly, so their text can be restored from
+    the decoded value. Float columns keep their original text alongside.
+    """
+    if all(map(_is_int, values)):
+        return "int"
+
+    if all(map(_is_float, values)):
+        return "float"
+
+    return "str"
+
+class Column(object):
+    """
+    Decoded column, holding every unique value once and a code into them for every row position.
+    """
+    __slots__ = ("type", "values", "codes")
+
+    type: str
+    values: list[ParamField]
+    codes: memoryview
+
+    def __init__(self, type: str, values: list[ParamField], codes: memoryview) -> None:
+        self.type = type
+        self.values = values
+        self.codes = codes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, position: int) -> ParamField:
+        return self.values[self.codes[position]]
+
+    def __iter__(self) -> Iterator[ParamField]:
+        return map(self.values.__getitem__, self.codes)
+
+    def select(self, test: Callable[[ParamField], bool]) -> list[bool]:
+        """
+        Evaluate `test` once per unique value, returning its result for every position.
+        """
+        results = [test(value) for value in self.values]
+        return list(map(results.__getitem__, self.codes))
+
+class ColumnarParam:
+    header: list[str]
+    row_count: int
+    source: Any
+
+    _buffer: bytes | mmap.mmap
+    _layout: dict[str, dict]
+    _columns: dict[str, Column]
+    _keys: memoryview | None   # sorted Row IDs
+    _order: memoryview | None  # positions of rows in `_keys` order
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        magic, version, header_length = _PREAMBLE.unpack_from(buffer)
+
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a compiled param or unsupported format version")
+
+        meta = json.loads(buffer[_PREAMBLE.size:_PREAMBLE.size + header_length])
+
+        if meta["byteorder"] != sys.byteorder:
+            raise ValueError("Compiled param has mismatched byte order")
+
+        self.header = [col["name"] for col in meta["columns"]]
+        self.row_count = meta["rows"]
+        self.source = meta["source"]
+
+        self._buffer = buffer
+        self._layout = {col["name"]: col for col in meta["columns"]}
+        self._columns = dict()
+        self._keys = None
+        self._order = None
+
+        if (index := meta["index"]) is not None:
+            view = lambda key, typecode: memoryview(buffer)[index[key][0]:sum(index[key])].cast(typecode)
+            self._keys = view("keys", "q")
+            self._order = view("order", index["typecode"])
+
+    def __contains__(self, __x: object) -> bool:
+        return __x in self._layout
+
+    def column(self, name: str) -> Column:
+        if (col := self._columns.get(name)) is not None:
+            return col
+
+        layout = self._layout[name]
+        codes_offset, codes_length = layout["codes"]
+
+        def load_block(key: str) -> list:
+            offset, length = layout[key]
+            return json.loads(self._buffer[offset:offset + length])
+
+        match layout["type"]:
+            case "int":
+                values = [ParamField.from_int(v) for v in load_block("values")]
+            case "float":
+                values = [ParamField.from_float(t, v) for t, v in zip(load_block("values"), load_block("numbers"))]
+            case _:
+                values = [ParamField(v) for v in load_block("values")]
+
+        codes = memoryview(self._buffer)[codes_offset:codes_offset + codes_length].cast(layout["typecode"])
+
+        col = self._columns[name] = Column(layout["type"], values, codes)
+        return col
+
+    def field(self, name: str, position: int) -> ParamField:
+        if (col := self._columns.get(name)) is None:
+            col = self.column(name)
+        return col.values[col.codes[position]]
+
+    def select(self, name: str, test: Callable[[ParamField], bool]) -> list[bool]:
+        return self.column(name).select(test)
+
+    def positions(self, id_min: int, id_max: int) -> list[int]:
+        """
+        Positions of rows with Row IDs in the inclusive range, in file order.
+        """
+        if self._keys is None or self._order is None:
+            return [pos for pos, row_id in enumerate(self.column("Row ID")) if id_min <= row_id.as_int <= id_max]
+
+        first = bisect_left(self._keys, id_min)
+        last = bisect_right(self._keys, id_max, lo=first)
+        return sorted(self._order[first:last])
+
+    def project(self, fields: Iterable[str]) -> "ProjectedParam":
+        return ProjectedParam(self, fields)
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sum(sys.getsizeof(v) for col in self._columns.values() for v in col.values)
+
+    @classmethod
+    def compile(cls, rows: Iterable[list[str]], source: Any) -> bytes:
+        """
+        Build the binary representation from CSV rows, first of which is the header.
+        Like `csv.DictReader` does, blank lines are skipped and rows are trimmed
+        or padded to the header length.
+        """
+        it = (row for row in rows if row != [])
+        header = next(it)
+        width = len(header)
+
+        lookups: list[dict[str | None, int]] = [dict() for _ in header]
+        codes: list[list[int]] = [list() for _ in header]
+        row_count = 0
+
+        for row in it:
+            if len(row) < width:
+                row = row + [None] * (width - len(row)) # type: ignore
+
+            for lookup, col_codes, value in zip(lookups, codes, row):
+                col_codes.append(lookup.setdefault(value, len(lookup)))
+
+            row_count += 1
+
+        blocks: list[bytes] = []
+        columns: list[dict] = []
+        offset = 0
+
+        def append_block(data: bytes) -> list[int]:
+            nonlocal offset
+            location = [offset, len(data)]
+            data += _padding(len(data))
+            blocks.append(data)
+            offset += len(data)
+            return location
+
+        def append_json(values: list) -> list[int]:
+            return append_block(json.dumps(values, ensure_ascii=False).encode("utf-8"))
+
+        for name, lookup, col_codes in zip(header, lookups, codes):
+            values = list(lookup.keys())
+            typecode = _code_typecode(len(values))
+            col = {"name": name, "type": _infer_type(values), "typecode": typecode}
+
+            match col["type"]:
+                case "int":
+                    col["values"] = append_json([int(v) for v in values]) # type: ignore
+                case "float":
+                    col["values"] = append_json(values)
+                    col["numbers"] = append_json([float(v) for v in values]) # type: ignore
+                case _:
+                    col["values"] = append_json(values)
+
+            col["codes"] = append_block(array(typecode, col_codes).tobytes())
+            columns.append(col)
+
+        index = None
+
+        if "Row ID" in header and columns[header.index("Row ID")]["type"] == "int":
+            row_id = header.index("Row ID")
+            ids = [int(v) for v in lookups[row_id].keys()] # type: ignore
+            order = sorted(range(row_count), key=lambda pos: ids[codes[row_id][pos]])
+
+            typecode = _code_typecode(row_count)
+            index = {"typecode": typecode}
+            index["keys"] = append_block(array("q", (ids[codes[row_id][pos]] for pos in order)).tobytes()) # type: ignore
+            index["order"] = append_block(array(typecode, order).tobytes()) # type: ignore
+
+        def make_header(data_offset: int) -> bytes:
+            relocate = lambda entry, keys: entry | {k: [entry[k][0] + data_offset, entry[k][1]] for k in keys if k in entry}
+            relocated = [relocate(col, ["values", "numbers", "codes"]) for col in columns]
+            meta = {"byteorder": sys.byteorder, "rows": row_count, "source": source, "columns": relocated,
+                    "index": None if index is None else relocate(index, ["keys", "order"])}
+            return json.dumps(meta).encode("utf-8")
+
+        # header size depends on the offsets it contains, settle on a fixed point
+        data_offset = 0
+        while True:
+            meta = make_header(data_offset)
+            start = _PREAMBLE.size + len(meta)
+            start += -start % _ALIGNMENT
+            if start == data_offset:
+                break
+            data_offset = start
+
+        preamble = _PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, len(meta))
+        return preamble + meta + _padding(_PREAMBLE.size + len(meta)) + b"".join(blocks)
+
+    @classmethod
+    def open(cls, path: Path, source: Any) -> Self | None:
+        """
+        Memory-map a compiled param, or return None if it is missing, invalid
+        or was compiled from a different source.
+        """
+        try:
+            with open(path, mode="rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            param = cls(buffer)
+
+        except (OSError, ValueError, struct.error):
+            return None
+
+        return param if param.source == source else None
+
+"""
+View of a compiled param restricted to the fields a table spec declared it reads.
+Declared columns are decoded up front and no other column is ever touched.
+Fields absent from the param are ignored, so that specs can declare alternatives
+like `iconId` and `iconIdM`. Reading an undeclared field is a bug in the spec and
+raises a KeyError. Row IDs and names can always be read, as every load reads them.
+"""
+class ProjectedParam(object):
+    __slots__ = ("header", "_param", "_columns")
+
+    header: list[str]
+
+    _param: ColumnarParam
+    _columns: dict[str, Column]
+
+    def __init__(self, param: ColumnarParam, fields: Iterable[str]) -> None:
+        self.header = [name for name in fields if name in param]
+        self._param = param
+        self._columns = {name: param.column(name) for name in self.header}
+
+    @property
+    def source(self) -> Any:
+        return self._param.source
+
+    def __contains__(self, __x: object) -> bool:
+        return __x in self._param
+
+    def _column(self, name: str) -> Column:
+        if (col := self._columns.get(name)) is not None:
+            return col
+
+        if name in ("Row ID", "Row Name"):
+            return self._param.column(name)
+
+        raise KeyError(f"Field \"{name}\" was not declared in the field projection")
+
+    def field(self, name: str, position: int) -> ParamField:
+        col = self._column(name)
+        return col.values[col.codes[position]]
+
+    def select(self, name: str, test: Callable[[ParamField], bool]) -> list[bool]:
+        return self._column(name).select(test)
@@ -1,8 +1,9 @@
 import json
-from pathlib import Path
+import hashlib
 
 from erdb.typing.game_version import GameVersion, GameVersionRange
-from erdb.loaders import PKG_DATA_PATH
+from erdb.loaders import PKG_DATA_PATH, CACHE_PATH, GAME_VERSIONS, write_cache_file
+from erdb.loaders.cache import SHARED as SHARED_CACHE
 
 
 def _overlay_properties(ret: dict, source: dict):
@@ -17,13 +18,7 @@ def _overlay_properties(ret: dict, source: dict):
         else:
             ret[key] = value
 
-def _parse_user_file(path: Path, version: GameVersion) -> dict:
-    assert path.is_file
-    assert path.suffix == ".json"
-
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
+def _resolve(data: dict, version: GameVersion) -> dict:
     ret = dict()
 
     for version_range, properties in data.items():
@@ -32,7 +27,64 @@ def _parse_user_file(path: Path, version: GameVersion) -> dict:
 
     return ret
 
+def _compile(element: str, source: list[list]) -> dict:
+    """
+    Parse every user file of an element once and resolve the version ranges
+    into per-version overlays for all known game versions. The result is
+    persisted in the cache directory until any of the files changes.
+    """
+    compiled = CACHE_PATH / "contrib" / f"{element}.json"
+
+    try:
+        with open(compiled, mode="r", encoding="utf-8") as f:
+            index = json.load(f)
+
+        if index["source"] == source:
+            return index
+
+    except (OSError, ValueError, KeyError):
+        pass
+
+    files = dict()
+
+    for name, _, _ in source:
+        path = PKG_DATA_PATH / "contrib" / element / name
+        assert path.suffix == ".json"
+
+        with open(path, mode="r", encoding="utf-8") as f:
+            files[path.stem] = json.load(f)
+
+    overlays = {str(v): {stem: _resolve(data, v) for stem, data in files.items()} for v in GAME_VERSIONS}
+
+    index = {"source": source, "files": files, "overlays": overlays}
+    write_cache_file(compiled, json.dumps(index, ensure_ascii=False).encode("utf-8"))
+
+    return index
+
 def load(element: str, version: GameVersion) -> dict[str, dict]:
     path = PKG_DATA_PATH / "contrib" / element
-    files = path.iterdir() if path.is_dir() else []
-    return {f.stem: _parse_user_file(f, version) for f in files}
\ No newline at end of file
+
+    if not path.is_dir():
+        return dict()
+
+    source = [[f.name, (st := f.stat()).st_size, st.st_mtime_ns] for f in sorted(path.iterdir()) if f.is_file()]
+    index = SHARED_CACHE.get(("contrib", element, json.dumps(source)), lambda: _compile(element, source))
+
+    if (overlay := index["overlays"].get(str(version))) is not None:
+        return overlay
+
+    # version unknown when the index was compiled
+    return {stem: _resolve(data, version) for stem, data in index["files"].items()}
+
+def digest(element: str) -> str:
+    """
+    Hash of the names and contents of all user files of an element.
+    """
+    path = PKG_DATA_PATH / "contrib" / element
+    files = sorted(path.iterdir()) if path.is_dir() else []
+
+    h = hashlib.sha256()
+    for f in (f for f in files if f.is_file()):
+        h.update(f.name.encode("utf-8") + b"\0" + f.read_bytes() + b"\0")
+
+    return h.hexdigest()
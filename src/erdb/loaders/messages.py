@@ -0,0 +1,128 @@
+"""
+Compiled, read-only store of a single FMG message file.
+
+Message IDs are kept in sorted order next to the offsets of their UTF-8 text
+inside a single blob. The file is memory-mapped, lookups bisect the IDs and
+decode only the requested message, which is then interned and memoized, so
+repeated lookups from different tables return the very same string.
+
+Layout: preamble (magic, format version, entry count, header length), JSON
+header, followed by 8-byte aligned ID array, offset array and text blob.
+"""
+
+import sys
+import json
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Self
+
+
+_MAGIC = b"ERDBMSG\0"
+_FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<8sIII")
+_ALIGNMENT = 8
+
+def _padding(offset: int) -> bytes:
+    return b"\0" * (-offset % _ALIGNMENT)
+
+class MessageStore(Mapping[int, str]):
+    source: Any
+
+    _buffer: bytes | mmap.mmap
+    _ids: memoryview
+    _offsets: memoryview
+    _text: memoryview
+    _decoded: dict[int, str]
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        magic, version, count, header_length = _PREAMBLE.unpack_from(buffer)
+
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a compiled message file or unsupported format version")
+
+        meta = json.loads(buffer[_PREAMBLE.size:_PREAMBLE.size + header_length])
+
+        if meta["byteorder"] != sys.byteorder:
+            raise ValueError("Compiled message file has mismatched byte order")
+
+        self.source = meta["source"]
+
+        ids_offset = _PREAMBLE.size + header_length
+        ids_offset += -ids_offset % _ALIGNMENT
+        offsets_offset = ids_offset + 8 * count
+        text_offset = offsets_offset + 4 * (count + 1)
+
+        view = memoryview(buffer)
+        self._buffer = buffer
+        self._ids = view[ids_offset:offsets_offset].cast("q")
+        self._offsets = view[offsets_offset:text_offset].cast("I")
+        self._text = view[text_offset:]
+        self._decoded = dict()
+
+    def _find(self, key: object) -> int:
+        if not isinstance(key, int):
+            return -1
+        pos = bisect_left(self._ids, key)
+        return pos if pos < len(self._ids) and self._ids[pos] == key else -1
+
+    def __getitem__(self, key: int) -> str:
+        if (text := self._decoded.get(key)) is not None:
+            return text
+
+        if (pos := self._find(key)) < 0:
+            raise KeyError(key)
+
+        text = self._decoded[key] = sys.intern(str(self._text[self._offsets[pos]:self._offsets[pos + 1]], "utf-8"))
+        return text
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._decoded or self._find(key) >= 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sum(sys.getsizeof(v) for v in self._decoded.values())
+
+    @classmethod
+    def compile(cls, entries: Iterable[tuple[int, str]], source: Any) -> bytes:
+        """
+        Build the binary representation from (ID, text) pairs. Later entries
+        replace earlier ones with the same ID, like building a dict would.
+        """
+        messages = dict(entries)
+        ids = sorted(messages.keys())
+
+        texts = [messages[i].encode("utf-8") for i in ids]
+        offsets = array("I", [0])
+        for text in texts:
+            offsets.append(offsets[-1] + len(text))
+
+        meta = json.dumps({"byteorder": sys.byteorder, "source": source}).encode("utf-8")
+        preamble = _PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, len(ids), len(meta))
+
+        return preamble + meta + _padding(_PREAMBLE.size + len(meta)) \
+            + array("q", ids).tobytes() + offsets.tobytes() + b"".join(texts)
+
+    @classmethod
+    def open(cls, path: Path, source: Any) -> Self | None:
+        """
+        Memory-map a compiled message file, or return None if it is missing,
+        invalid or was compiled from a different source.
+        """
+        try:
+            with open(path, mode="rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            store = cls(buffer)
+
+        except (OSError, ValueError, struct.error):
+            return None
+
+        return store if store.source == source else None
@@ -1,30 +1,95 @@
-from typing import Iterator
+import io
+import csv
 import xml.etree.ElementTree as xmltree
-from csv import DictReader
-from zipfile import Path as ZipPath
+from typing import Any, Iterable, Iterator
 
-from erdb.loaders import PKG_DATA_PATH
+from erdb.loaders import CACHE_PATH, write_cache_file, archives
+from erdb.loaders.archives import GamedataArchive
+from erdb.loaders.columnar import ColumnarParam
+from erdb.loaders.messages import MessageStore
+from erdb.loaders.cache import SHARED as SHARED_CACHE
 from erdb.typing.game_version import GameVersion
 from erdb.typing.params import ParamRow, ParamDict
 from erdb.typing.enums import ItemIDFlag
 
 
-def _load(param: str, version: GameVersion) -> Iterator[dict[str, str]]:
-    archive = PKG_DATA_PATH / "gamedata" / f"{version}.zip"
-    with ZipPath(archive, at=f"{param}.csv").open(mode="r") as f:
-        yield from DictReader(f, delimiter=";") # type: ignore
+def _compile(param: str, version: GameVersion) -> ColumnarParam:
+    """
+    Retrieve the compiled columnar representation of a param, building it
+    from the gamedata archive on first use or whenever the archive changes.
+    Shared between all loads of the param, so columns are decoded only once.
+    """
+    return SHARED_CACHE.get(("compiled", str(version), param), lambda: _open_compiled(param, version))
 
-def load(param: str, version: GameVersion, item_id_flag: ItemIDFlag) -> ParamDict:
-    return {int(row["Row ID"]): ParamRow.make(row, item_id_flag) for row in _load(param, version)}
+def _open_compiled(param: str, version: GameVersion) -> ColumnarParam:
+    archive = archives.get(version)
+    compiled = CACHE_PATH / "params" / str(version) / f"{param}.col"
+    source = archive.member_source(f"{param}.csv")
+
+    if (table := ColumnarParam.open(compiled, source)) is not None:
+        return table
+
+    with io.TextIOWrapper(archive.open(f"{param}.csv")) as f:
+        data = ColumnarParam.compile(csv.reader(f, delimiter=";"), source)
+
+    if write_cache_file(compiled, data) and (table := ColumnarParam.open(compiled, source)) is not None:
+        return table
+
+    return ColumnarParam(data)
+
+def _load(param: str, version: GameVersion, item_id_flag: ItemIDFlag, id_min: int | None = None, id_max: int | None = None,
+          fields: Iterable[str] | None = None) -> ParamDict:
+    table = _compile(param, version)
+    storage = table if fields is None else table.project(fields)
+    row_ids, names = table.column("Row ID"), table.column("Row Name")
+    ret: ParamDict = dict()
+
+    # range loads only visit matching rows, found via the sorted Row ID index
+    positions = range(table.row_count) if id_min is None else table.positions(id_min, id_max) # type: ignore
+
+    for position in positions:
+        index = row_ids[position].as_int
+        ret[index] = ParamRow(index, item_id_flag, str(names[position]), storage, position)
+
+    return ret
+
+def load(param: str, version: GameVersion, item_id_flag: ItemIDFlag, fields: Iterable[str] | None = None) -> ParamDict:
+    return _load(param, version, item_id_flag, fields=fields)
 
 # optimal variant for params with a lot of IDs like spEffects
-def load_ids(param: str, version: GameVersion, item_id_flag: ItemIDFlag, id_min: int, id_max: int = 999999999) -> ParamDict:
-    return {int(row["Row ID"]): ParamRow.make(row, item_id_flag) for row in _load(param, version) if id_min <= int(row["Row ID"]) <= id_max}
+def load_ids(param: str, version: GameVersion, item_id_flag: ItemIDFlag, id_min: int, id_max: int = 999999999,
+             fields: Iterable[str] | None = None) -> ParamDict:
+    return _load(param, version, item_id_flag, id_min, id_max, fields)
+
+def source(param: str, version: GameVersion) -> Any:
+    """
+    Source of a param shared by all of its loads, see `erdb.typing.params.param_source`.
+    """
+    return _compile(param, version).source
+
+def _parse_fmg(archive: GamedataArchive, filename: str) -> Iterator[tuple[int, str]]:
+    with archive.open(f"{filename}.fmg.xml") as f:
+        for _, elem in xmltree.iterparse(f):
+            if elem.tag == "text":
+                if elem.text != "%null%":
+                    yield int(str(elem.get("id"))), str(elem.text)
+                elem.clear()
+
+def load_msg(filename: str, version: GameVersion) -> MessageStore:
+    """
+    Retrieve the compiled message store of an FMG file, building it from the
+    gamedata archive on first use or whenever the archive changes.
+    """
+    archive = archives.get(version)
+    compiled = CACHE_PATH / "msgs" / str(version) / f"{filename}.msg"
+    source = archive.member_source(f"{filename}.fmg.xml")
+
+    if (store := MessageStore.open(compiled, source)) is not None:
+        return store
+
+    data = MessageStore.compile(_parse_fmg(archive, filename), source)
 
-def load_msg(filename: str, version: GameVersion) -> dict[int, str]:
-    archive = PKG_DATA_PATH / "gamedata" / f"{version}.zip"
-    with ZipPath(archive, at=f"{filename}.fmg.xml").open(mode="r", encoding="utf-8") as f:
-        tree = xmltree.fromstring(f.read())
-        entries = tree.findall(".//text")
+    if write_cache_file(compiled, data) and (store := MessageStore.open(compiled, source)) is not None:
+        return store
 
-    return {int(str(e.get("id"))): str(e.text) for e in entries if e.text != "%null%"}
\ No newline at end of file
+    return MessageStore(data)
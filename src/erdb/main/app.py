@@ -1,17 +1,22 @@
+import os
 import json
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Sequence
+from typing import NamedTuple, Self, Sequence
 
 from erdb.main.args import parse_args
-from erdb.table import Table
-from erdb.loaders import GAME_VERSIONS
+from erdb.table import Generator, Table
+from erdb.loaders import GAME_VERSIONS, write_cache_file
+from erdb.loaders.cache import SHARED as SHARED_CACHE
+from erdb.effect_parser import compile_version as compile_effect_table, resolution_stats as effect_resolution_stats
 from erdb.app_api.main import serve as serve_app_api
 from erdb.app_wiki import generate as generate_app_wiki
 from erdb.utils.attack_power import Attributes, CalculatorData, ArmamentCalculator
 from erdb.utils.changelog import generate as generate_changelog
 from erdb.utils.find_valid_values import find_valid_values
 from erdb.utils.sourcer import source_gamedata, source_map, source_icons
-from erdb.utils.common import Destination, pydantic_encoder_no_nulls
+from erdb.utils.common import Destination
+from erdb.utils.json_writer import write_table
 from erdb.typing.game_version import GameVersion, GameVersionRange
 
 
@@ -21,6 +26,7 @@ class App:
     def __init__(self, argv: Sequence[str]) -> None:
         self.args = parse_args(argv, handlers={
             "generate": self.generate,
+            "compile-effects": self.compile_effects,
             "find-values": self.find_values,
             "calculate-ar": self.calculate_ar,
             "changelog": self.changelog,
@@ -36,31 +42,71 @@ class App:
         return handler(**self.args)
 
     @staticmethod
-    def generate(tables: list[Table], gamedata: GameVersionRange, minimize: bool, out: Path | None) -> int:
+    def generate(tables: list[Table], gamedata: GameVersionRange, minimize: bool, out: Path | None, jobs: int, force: bool,
+                 trusted: bool, validate_sample: float) -> int:
         if out is None:
             out = Path.cwd()
         else:
             out = out.resolve()
 
+        plan: list[tuple[GameVersion, _OutputManifest, dict[Table, str]]] = []
+
         for version in gamedata.iterate(GAME_VERSIONS):
             destination = out / str(version)
             destination.mkdir(parents=True, exist_ok=True)
 
-            for tb, gen in ((tb, tb.make_generator(version)) for tb in tables):
+            manifest = _OutputManifest.load(destination)
+            digests = {tb: tb.input_digest(version, minimize) for tb in tables}
+            stale = {tb: digest for tb, digest in digests.items() if force or not manifest.is_current(tb, digest)}
+
+            if len(stale) < len(tables):
+                print(f"\n>>> Skipping {len(tables) - len(stale)} up-to-date tables from version {version}, use --force to regenerate", flush=True)
+
+            if len(stale) > 0:
+                plan.append((version, manifest, stale))
+
+        construction = _Construction(trusted, validate_sample)
+
+        if jobs > 1:
+            if force:
+                # once per version up front, rather than concurrently by every lane of it
+                for version, _, stale in plan:
+                    Table.compile_effects(stale.keys(), version, force)
+
+            return _generate_parallel(plan, minimize, construction, jobs)
+
+        for version, manifest, stale in plan:
+            print(f"\n>>> Loading gamedata of {len(stale)} tables from version {version}", flush=True)
+            Table.compile_effects(stale.keys(), version, force)
+            generators = Table.make_generators(stale.keys(), version)
+
+            for (tb, digest), gen in zip(stale.items(), generators):
                 print(f"\n>>> Generating \"{tb}\" from version {version}", flush=True)
 
-                output_file = destination / f"{tb}.json"
+                output_file = manifest.output_file(tb)
                 print(f"Output file: {output_file}", flush=True)
 
                 if output_file.exists():
                     print(f"Output file exists and will be overridden", flush=True)
 
-                data = gen.generate()
-                print(f"Generated {len(data)} elements", flush=True)
+                count = _write_table(gen, output_file, minimize, construction)
+                manifest.update(tb, digest)
+                print(f"Generated {count} elements", flush=True)
+
+        print(f"\n>>> Loader cache: {SHARED_CACHE.stats()}", flush=True)
+        print(f">>> Effect resolution cache: {effect_resolution_stats()}", flush=True)
+        return 0
+
+    @staticmethod
+    def compile_effects(gamedata: GameVersionRange, force: bool) -> int:
+        for version in gamedata.iterate(GAME_VERSIONS):
+            print(f"\n>>> Compiling effects of version {version}", flush=True)
+
+            if (row_count := compile_effect_table(version, force)) is None:
+                print(f"SpEffectParam of version {version} cannot be compiled", flush=True)
+                return 1
 
-                with open(output_file, mode="w", encoding="utf-8") as f:
-                    kwargs = {"separators": (",", ":")} if minimize else {"indent": 4}
-                    json.dump(data, f, ensure_ascii=False, default=pydantic_encoder_no_nulls, allow_nan=False, **kwargs)
+            print(f"Compiled {row_count} SpEffects", flush=True)
 
         return 0
 
@@ -176,4 +222,102 @@ class App:
         out = Path.cwd() / "erdb.wiki" if out is None else out.resolve()
 
         generate_app_wiki(uikit_version, pyscript_version, data_path, minimize, out)
-        return 0
\ No newline at end of file
+        return 0
+
+class _Construction(NamedTuple):
+    trusted: bool
+    validate_sample: float
+
+def _write_table(gen: Generator, output_file: Path, minimize: bool, construction: _Construction) -> int:
+    # moved into place once complete, a failed generation leaves the previous output intact
+    temp_file = output_file.with_name(f".{output_file.name}.tmp")
+
+    try:
+        with open(temp_file, mode="w", encoding="utf-8") as f:
+            count = write_table(gen.iterate(None, *construction), f, minimize)
+
+        os.replace(temp_file, output_file)
+        return count
+
+    finally:
+        temp_file.unlink(missing_ok=True)
+
+def _generate_unit(tb: Table, version: GameVersion, output_file: Path, minimize: bool, construction: _Construction) -> int:
+    # runs in a worker process, loaded data stays in its cache for next units of the same version
+    Table.compile_effects([tb], version)
+    return _write_table(tb.make_generator(version), output_file, minimize, construction)
+
+def _generate_parallel(plan: list[tuple[GameVersion, "_OutputManifest", dict[Table, str]]], minimize: bool, construction: _Construction, jobs: int) -> int:
+    """
+    Schedule (version, table) units onto single-process lanes. Units of the
+    same version always go to the same lane, which loads their gamedata once,
+    unless there are fewer versions than lanes, in which case the tables of a
+    version are split between several lanes.
+    """
+    if len(plan) == 0:
+        return 0
+
+    lanes_per_version = max(1, jobs // len(plan))
+    lanes = [ProcessPoolExecutor(max_workers=1) for _ in range(min(jobs, len(plan) * lanes_per_version))]
+
+    futures: dict[Future, tuple[Table, GameVersion, _OutputManifest, str]] = dict()
+
+    print(f"\n>>> Generating {sum(len(stale) for _, _, stale in plan)} tables from {len(plan)} versions using {len(lanes)} processes", flush=True)
+
+    try:
+        for version_index, (version, manifest, stale) in enumerate(plan):
+            for table_index, (tb, digest) in enumerate(stale.items()):
+                lane = (version_index * lanes_per_version + table_index % lanes_per_version) % len(lanes)
+                future = lanes[lane].submit(_generate_unit, tb, version, manifest.output_file(tb), minimize, construction)
+                futures[future] = (tb, version, manifest, digest)
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            tb, version, manifest, digest = futures[future]
+            count = future.result()
+            manifest.update(tb, digest)
+            print(f"[{done}/{len(futures)}] Generated {count} elements of \"{tb}\" from version {version}", flush=True)
+
+    finally:
+        for lane in lanes:
+            lane.shutdown(cancel_futures=True)
+
+    return 0
+
+"""
+Digests of the inputs every table in an output directory was generated from,
+kept next to the output, so that tables whose inputs did not change are skipped.
+The size of every output is recorded too, so that missing or modified outputs
+are regenerated.
+"""
+class _OutputManifest(NamedTuple):
+    path: Path
+    entries: dict[str, list] # [input digest, output size] per table
+
+    @classmethod
+    def load(cls, destination: Path) -> Self:
+        path = destination / ".manifest.json"
+
+        try:
+            with open(path, mode="r", encoding="utf-8") as f:
+                entries = json.load(f)
+
+        except (OSError, ValueError):
+            entries = dict()
+
+        return cls(path, entries if isinstance(entries, dict) else dict())
+
+    def output_file(self, tb: Table) -> Path:
+        return self.path.parent / f"{tb}.json"
+
+    def _output_size(self, tb: Table) -> int | None:
+        try:
+            return self.output_file(tb).stat().st_size
+        except OSError:
+            return None
+
+    def is_current(self, tb: Table, digest: str) -> bool:
+        return self.entries.get(str(tb)) == [digest, self._output_size(tb)]
+
+    def update(self, tb: Table, digest: str):
+        self.entries[str(tb)] = [digest, self._output_size(tb)]
+        write_cache_file(self.path, json.dumps(dict(sorted(self.entries.items())), indent=4).encode("utf-8"))
@@ -143,6 +143,13 @@ class _Subcommand(NamedTuple):
         to_str = lambda x: f"[EXAMPLE] {x[0]}\n$ {x[1]}"
         return "\n\n".join(map(to_str, cls.examples))
 
+    @classmethod
+    def check(cls, args: dict[str, Any]) -> str | None:
+        """
+        Error message for invalid argument values or combinations argparse cannot express, if any.
+        """
+        return None
+
 class Generate(_Subcommand):
     command = "generate"
     summary = "Generate JSON data for specified tables."
@@ -167,11 +174,56 @@ class Generate(_Subcommand):
             "Generate all data for all versions from 1.06.0 (including), minimize the JSON output",
             "erdb gen all --gamedata until 1.06.0 --minimize",
         ),
+        (
+            "Generate all data for every version using 16 worker processes",
+            "erdb gen all --gamedata any version --jobs 16",
+        ),
+        (
+            "Generate all data without validation, except for a random 5% of elements",
+            "erdb gen all --trusted --validate-sample 0.05",
+        ),
     ]
 
     arguments = [
         _Argument.make("tables", type=Table, default=[], choices=list(Table), nargs="+", action=_TablesAction, help="Specify any or all tables.")
-    ] + _Argument.parses_gamedata() + _Argument.outputs_json()
+    ] + _Argument.parses_gamedata() + _Argument.outputs_json() + [
+        _Argument.make("--jobs", "-j", type=int, default=1, metavar="NUM", help="Number of worker processes generating tables in parallel (default 1)."),
+        _Argument.make("--force", action="store_true", help="Regenerate tables even if their inputs did not change since the last generation."),
+        _Argument.make("--trusted", action="store_true", help="Construct the output without validating it against the schema, which is considerably faster."),
+        _Argument.make("--validate-sample", type=float, default=0.0, metavar="FRACTION", help="With --trusted, fully validate a random fraction of elements between 0 and 1 (default 0)."),
+    ]
+
+    @classmethod
+    def check(cls, args: dict[str, Any]) -> str | None:
+        if not 0.0 <= args["validate_sample"] <= 1.0:
+            return "--validate-sample must be between 0 and 1"
+
+        if args["validate_sample"] > 0.0 and not args["trusted"]:
+            return "--validate-sample requires --trusted"
+
+        return None
+
+class CompileEffects(_Subcommand):
+    command = "compile-effects"
+    summary = "Resolve effects of every SpEffect into a compiled table."
+    details = """\
+    Resolve effects of every SpEffect of the specified versions, including referenced SpEffects and hardcoded overrides.
+    The resulting tables are stored in the cache, where table generation looks effects up instead of resolving them.
+    Generating tables does this automatically, tables are recompiled only when the SpEffect param, the effect parser or the erdb version changes.
+    """
+
+    aliases = ["effects"]
+
+    examples = [
+        (
+            "Compile effects of every version, recompiling existing tables",
+            "erdb compile-effects --gamedata any version --force",
+        ),
+    ]
+
+    arguments = _Argument.parses_gamedata() + [
+        _Argument.make("--force", action="store_true", help="Recompile effects even if the compiled table is up-to-date."),
+    ]
 
 class FindValues(_Subcommand):
     command = "find-values"
@@ -417,6 +469,12 @@ def parse_args(argv: Sequence[str], handlers: dict[str, Callable]) -> dict[str,
         for arg in cmd.arguments:
             p.add_argument(*arg.names, **arg.kwargs)
 
-        p.set_defaults(handler=handler)
+        p.set_defaults(handler=handler, subcommand=(cmd, p))
+
+    args = vars(parser.parse_args(argv))
+    cmd, p = args.pop("subcommand")
+
+    if (error := cmd.check(args)) is not None:
+        p.error(error)
 
-    return vars(parser.parse_args(argv))
\ No newline at end of file
+    return args
\ No newline at end of file
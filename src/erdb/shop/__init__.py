@@ -4,22 +4,25 @@ from erdb.shop.shop_typing import Material, Lineup, Product
 
 """
 Helper class for looking up any sort of item exchanges (purchases, alterations, crafting...)
+Lineups are parsed once on construction and indexed by the materials they consume,
+so that every query is a dictionary lookup.
 """
 class Lookup(object):
     _shop_lineup: ParamDict
     _material_sets: ParamDict
+    _by_material: dict[Material, list[Lineup]]
 
     def __init__(self, shop_lineup: ParamDict, material_sets: ParamDict) -> None:
         self._shop_lineup = shop_lineup
         self._material_sets = material_sets
-
-    def get_lineups_from_material(self, material: Material) -> list[Lineup]:
-        lineups: list[Lineup] = []
+        self._by_material = dict()
 
         for lineup_param in self._shop_lineup.values():
             if mat_id := lineup_param["mtrlId"].get_int():
                 lineup = Lineup.from_params(lineup_param, self._material_sets[mat_id])
-                if material in lineup.materials.keys():
-                    lineups.append(lineup)
 
-        return lineups
\ No newline at end of file
+                for material in lineup.materials.keys():
+                    self._by_material.setdefault(material, []).append(lineup)
+
+    def get_lineups_from_material(self, material: Material) -> list[Lineup]:
+        return list(self._by_material.get(material, []))
@@ -1,8 +1,12 @@
+import random
+import hashlib
+from pathlib import Path
 from enum import StrEnum
-from typing import Any, Self, NamedTuple
+from typing import Any, Hashable, Iterable, Iterator, Self, NamedTuple
 
+from erdb import __version__
 from erdb.table._retrievers import RetrieverData
-from erdb.table._common import TableSpec
+from erdb.table._common import TableSpec, filter_rows
 from erdb.table.ammo import AmmoTableSpec
 from erdb.table.armaments import ArmamentTableSpec
 from erdb.table.armor import ArmorTableSpec
@@ -21,8 +25,22 @@ from erdb.table.spirit_ashes import SpiritAshTableSpec
 from erdb.table.talismans import TalismanTableSpec
 from erdb.table.tools import ToolTableSpec
 from erdb.typing.game_version import GameVersion
-from erdb.typing.api_version import ApiVersion
 from erdb.typing.params import ParamRow
+from erdb.typing.api_version import ApiVersion
+from erdb.typing.models.trusted import trusted_construction
+from erdb.effect_parser import compile_version as compile_effect_table
+
+
+"""
+Digest of the sources of the whole package. Any change to the code which
+produces tables, from specs and effect parsing to models and serialization,
+invalidates every generated table.
+"""
+_PACKAGE = Path(__file__).parent.parent
+_SOURCES: str = hashlib.sha256(b"".join(
+    str(path.relative_to(_PACKAGE)).encode("utf-8") + b"\0" + path.read_bytes() + b"\0"
+    for path in sorted(_PACKAGE.rglob("*.py"))
+)).hexdigest()
 
 
 class Generator(NamedTuple):
@@ -30,35 +48,80 @@ class Generator(NamedTuple):
     data: RetrieverData
 
     def generate(self, api: ApiVersion | None = None) -> dict:
+        return dict(self.iterate(api))
+
+    def iterate(self, api: ApiVersion | None = None, trusted: bool = False, validate_sample: float = 0.0) -> Iterator[tuple[str, Any]]:
+        """
+        Lazily yield (pk, object) pairs in param order of the rows passing the predicates.
+        Primary keys are resolved first, a repeated key keeps its first position
+        and is made from the last of its rows, like building a dict would.
+
+        Trusted generation constructs objects without validating them, except for
+        a random `validate_sample` fraction, which is constructed both ways and
+        checked to match.
+        """
         api = self.spec.latest_api() if api is None else api
+        sample = random.Random(self.spec.title())
+
+        rows: dict[str, ParamRow] = dict()
 
-        def key(row: ParamRow) -> Any:
-            return self.spec.get_pk(self.data, row)
+        for row in filter_rows(self.data.main_param.values(), self.spec.predicates):
+            rows[self.spec.get_pk(self.data, row)] = row
 
-        def value(row: ParamRow) -> Any:
-            return self.spec.make_object(api, self.data, row)
+        for pk, row in rows.items():
+            if not trusted:
+                yield pk, self.spec.make_object(api, self.data, row)
+                continue
 
-        def valid(row: ParamRow) -> bool:
-            return all(pred(row) for pred in self.spec.predicates)
+            with trusted_construction(self.spec.model.values()):
+                obj = self.spec.make_object(api, self.data, row)
 
-        rows = self.data.main_param.values()
-        return {key(row): value(row) for row in rows if valid(row)}
+            if sample.random() < validate_sample:
+                validated = self.spec.make_object(api, self.data, row)
+
+                if obj != validated:
+                    raise ValueError(f"Trusted construction of \"{pk}\" differs from validated construction")
+
+            yield pk, obj
 
     @classmethod
     def create(cls, spec: TableSpec, version: GameVersion) -> Self:
+        return cls.create_many([spec], version)[0]
+
+    @classmethod
+    def create_many(cls, specs: Iterable[TableSpec], version: GameVersion) -> list[Self]:
+        """
+        Create generators of multiple specs for the same game version. The
+        retriever requirements of all specs are merged, so that every param,
+        msg file, shop lookup and contrib set is loaded once and shared.
+        """
+        loaded: dict[Hashable, Any] = dict()
+        memo: dict[Hashable, Any] = dict()
+
+        def retrieve(retriever: Any, *args: Any) -> Any:
+            # retrievers of different types may compare equal as tuples
+            key = (type(retriever), retriever, *args)
+            if key not in loaded:
+                loaded[key] = retriever.get(*args, version)
+            return loaded[key]
+
         def retrieve_dict(retrievers: dict):
-            return {field: retrievers[field].get(version) for field in retrievers.keys()}
-
-        return cls(
-            spec,
-            RetrieverData(
-                spec.main_param_retriever.get(version),
-                retrieve_dict(spec.param_retrievers),
-                retrieve_dict(spec.msg_retrievers),
-                retrieve_dict(spec.shop_retrievers),
-                spec.contrib_retriever.get(spec.title(), version),
+            return {field: retrieve(retriever) for field, retriever in retrievers.items()}
+
+        return [
+            cls(
+                spec,
+                RetrieverData(
+                    retrieve(spec.main_param_retriever),
+                    retrieve_dict(spec.param_retrievers),
+                    retrieve_dict(spec.msg_retrievers),
+                    retrieve_dict(spec.shop_retrievers),
+                    retrieve(spec.contrib_retriever, spec.title()),
+                    memo,
+                )
             )
-        )
+            for spec in specs
+        ]
 
 class Table(StrEnum):
     ALL = "all"
@@ -90,6 +153,23 @@ class Table(StrEnum):
     def make_generator(self, version: GameVersion) -> Generator:
         return Generator.create(self.spec, version)
 
+    @classmethod
+    def make_generators(cls, tables: Iterable[Self], version: GameVersion) -> list[Generator]:
+        return Generator.create_many((tb.spec for tb in tables), version)
+
+    @classmethod
+    def compile_effects(cls, tables: Iterable[Self], version: GameVersion, force: bool = False):
+        """
+        Compile the effect table of a version if any of the tables parses effects,
+        so that their generators look effects up instead of resolving them.
+        """
+        if any(tb.reads_param("SpEffectParam") for tb in tables):
+            compile_effect_table(version, force)
+
+    def reads_param(self, param_name: str) -> bool:
+        spec = self.spec
+        return any(retriever.param_name == param_name for retriever in [spec.main_param_retriever, *spec.param_retrievers.values()])
+
     @property
     def spec(self) -> TableSpec:
         return {
@@ -112,6 +192,21 @@ class Table(StrEnum):
             Table.TOOLS: ToolTableSpec,
         }[self]
 
+    def input_digest(self, version: GameVersion, *options: Any) -> str:
+        """
+        Digest of everything the generated table depends on: the gamedata read
+        by the spec's retrievers, its contrib files, the API version, the erdb
+        version and sources and any output options.
+        """
+        spec = self.spec
+        retrievers = [spec.main_param_retriever, *spec.param_retrievers.values(), *spec.msg_retrievers.values(), *spec.shop_retrievers.values()]
+
+        inputs = [__version__, _SOURCES, str(spec.latest_api()), *map(str, options)]
+        inputs += [retriever.digest(version) for retriever in retrievers]
+        inputs += [spec.contrib_retriever.digest(spec.title(), version)]
+
+        return hashlib.sha256("\n".join(inputs).encode("utf-8")).hexdigest()
+
     @property
     def param_name(self) -> str:
         return self.spec.main_param_retriever.param_name
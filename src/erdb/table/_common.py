@@ -1,19 +1,100 @@
-from typing import Any, Callable, Protocol
+from typing import Any, Callable, Hashable, Iterable, Mapping, NamedTuple, Protocol, Self
 from unicodedata import normalize, combining
 
 from erdb.utils.common import get_filename
 from erdb.typing.enums import GoodsRarity
-from erdb.typing.params import ParamRow
+from erdb.typing.params import ParamDict, ParamField, ParamRow, select_rows
 from erdb.typing.api_version import ApiVersion
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, ShopRetriever, ContribRetriever, RetrieverData
 
 
-RowPredicate = Callable[[ParamRow], bool]
+"""
+Declarative predicate testing a single field of a row. Unlike an arbitrary
+`RowPredicate`, it is evaluated over the whole param column at once, running
+the test once per unique value. Tests on "Row Name" receive the row's name.
+"""
+class FieldPredicate(NamedTuple):
+    field: str
+    test: Callable[[ParamField], bool]
+
+    def __call__(self, row: ParamRow) -> bool:
+        return self.test(ParamField(row.name) if self.field == "Row Name" else row[self.field])
+
+    @classmethod
+    def equals(cls, field: str, value: Any) -> Self:
+        return cls(field, lambda v: v == value)
+
+    @classmethod
+    def one_of(cls, field: str, values: Iterable[Any]) -> Self:
+        values = tuple(values)
+        return cls(field, lambda v: v in values)
+
+    @classmethod
+    def int_one_of(cls, field: str, values: Iterable[int]) -> Self:
+        values = frozenset(int(v) for v in values)
+        return cls(field, lambda v: v.as_int in values)
+
+    @classmethod
+    def int_range(cls, field: str, begin: int, end: int) -> Self:
+        """
+        Integer value of the field is within the half-open range [begin, end).
+        """
+        return cls(field, lambda v: begin <= v.as_int < end)
+
+    @classmethod
+    def name(cls, test: Callable[[str], bool]) -> Self:
+        return cls("Row Name", test)
+
+    def negate(self) -> Self:
+        return type(self)(self.field, lambda v: not self.test(v))
+
+RowPredicate = FieldPredicate | Callable[[ParamRow], bool]
+
+def filter_rows(rows: Iterable[ParamRow], predicates: Iterable[RowPredicate]) -> list[ParamRow]:
+    """
+    Keep rows passing all predicates. Declarative predicates are applied first
+    as column masks, leaving arbitrary ones to run only for the remaining rows.
+    """
+    rows = list(rows)
+    remaining: list[Callable[[ParamRow], bool]] = []
+
+    for pred in predicates:
+        if isinstance(pred, FieldPredicate):
+            rows = select_rows(rows, pred.field, pred.test)
+        else:
+            remaining.append(pred)
+
+    return [row for row in rows if all(pred(row) for pred in remaining)]
+
+# fields read by `TableSpecContext.make_item`, include in field projections of main params
+ITEM_FIELDS = ("disableMultiDropShare", "sellValue", "rarity", "iconId", "iconIdM", "maxNum", "maxRepositoryNum")
 
 def _remove_accents(string: str) -> str:
     nfkd_form = normalize("NFKD", string)
     return "".join(c for c in nfkd_form if not combining(c))
 
+def _memo(data: RetrieverData, key: Hashable, factory: Callable[[], Any]) -> Any:
+    if (value := data.memo.get(key)) is None:
+        value = data.memo[key] = factory()
+    return value
+
+"""
+Primary keys of the entries of a names msg file, each normalized once on first
+lookup. Shared by all tables of a version which read the same file.
+"""
+class _NameKeys(dict[int, str]):
+    names: Mapping[int, str]
+    parse_name: Callable[[str], str]
+
+    def __init__(self, names: Mapping[int, str], parse_name: Callable[[str], str]) -> None:
+        super().__init__()
+        self.names = names
+        self.parse_name = parse_name
+
+    def __missing__(self, index: int) -> str:
+        pk = self[index] = _remove_accents(self.parse_name(self.names[index]))
+        return pk
+
 class TableSpec(Protocol):
     model: dict[ApiVersion, Any]
 
@@ -70,7 +151,11 @@ class TableSpecContext:
     @classmethod # override
     def get_pk(cls, data: RetrieverData, row: ParamRow) -> str:
         assert "names" in data.msgs, "names were not parsed, override get_pk() for non-standard pk"
-        return _remove_accents(cls.parse_name(data.msgs["names"][row.index]))
+        names = data.msgs["names"]
+
+        # keyed by the underlying function, so that specs not overriding it share the table
+        key = ("pks", id(names), cls.parse_name.__func__) # type: ignore
+        return _memo(data, key, lambda: _NameKeys(names, cls.parse_name))[row.index]
 
     @classmethod
     def parse_name(cls, name: str) -> str:
@@ -78,6 +163,16 @@ class TableSpecContext:
 
     @classmethod
     def make_item(cls, data: RetrieverData, row: ParamRow, *, summary: bool = True, description: bool = True) -> dict[str, Any]:
+        """
+        Base fields of an item, computed once per row and reused by every API
+        version and table. The returned dict is shared and must not be modified.
+        """
+        msgs = [id(data.msgs.get(name)) for name in ("names", "summaries", "descriptions")]
+        key = ("item", row, *msgs, summary, description, cls.parse_name.__func__) # type: ignore
+        return _memo(data, key, lambda: cls._make_item(data, row, summary=summary, description=description))
+
+    @classmethod
+    def _make_item(cls, data: RetrieverData, row: ParamRow, *, summary: bool, description: bool) -> dict[str, Any]:
         assert "names" in data.msgs, "make_item() cannot be called without names parsed"
         assert not summary or "summaries" in data.msgs, "Summary specified, yet no summaries were parsed"
         assert not description or "descriptions" in data.msgs, "Description specified, yet no descriptions were parsed"
@@ -100,12 +195,40 @@ class TableSpecContext:
             "max_stored": row["maxRepositoryNum"].as_int if "maxRepositoryNum" in row else 999,
         }
 
+    @classmethod
+    def memoize(cls, data: RetrieverData, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Value derived from the retrieved data, built once and shared by all tables
+        of a version. Keys must not collide with those of other tables.
+        """
+        return _memo(data, key, factory)
+
+    @classmethod
+    def group_by(cls, data: RetrieverData, field: str, param: ParamDict | None = None) -> dict[str, list[ParamRow]]:
+        """
+        Rows of a param grouped by the value of a field, main param by default.
+        Built once and shared by all tables of a version.
+        """
+        rows = data.main_param if param is None else param
+
+        def build() -> dict[str, list[ParamRow]]:
+            groups: dict[str, list[ParamRow]] = dict()
+            for row in rows.values():
+                groups.setdefault(row[field], []).append(row)
+            return groups
+
+        return _memo(data, ("groups", id(rows), field), build)
+
     @classmethod
     def make_contrib(cls, data: RetrieverData, row: ParamRow, *fields: str) -> dict[str, Any]:
         row_name = cls.get_pk(data, row)
+        filenames: dict[str, str] = _memo(data, "filenames", dict)
+
+        if (filename := filenames.get(row_name)) is None:
+            filename = filenames[row_name] = get_filename(row_name)
 
         def get_user_value(field: str):
-            return data.contrib.get(get_filename(row_name), {}).get(field)
+            return data.contrib.get(filename, {}).get(field)
 
         user_data = {field: get_user_value(field) for field in fields}
         user_data = {k: v for k, v in user_data.items() if v is not None}
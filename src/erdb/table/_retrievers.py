@@ -1,8 +1,10 @@
-from typing import NamedTuple
+from typing import Any, Hashable, Mapping, NamedTuple
 
 from erdb.typing.game_version import GameVersion
 from erdb.loaders.params import load as load_params, load_ids as load_param_ids, load_msg
-from erdb.loaders.contrib import load as load_contrib
+from erdb.loaders import archives
+from erdb.loaders.contrib import load as load_contrib, digest as contrib_digest
+from erdb.loaders.cache import SHARED as SHARED_CACHE
 from erdb.typing.params import ParamDict
 from erdb.typing.enums import ItemIDFlag
 from erdb.shop import Lookup
@@ -11,21 +13,26 @@ from erdb.shop import Lookup
 class RetrieverData(NamedTuple):
     main_param: ParamDict
     params: dict[str, ParamDict]
-    msgs: dict[str, dict[int, str]]
+    msgs: dict[str, Mapping[int, str]]
     shops: dict[str, Lookup]
     contrib: dict[str, dict]
+    memo: dict[Hashable, Any] # values derived from rows, shared by all tables of a version
 
 class ParamDictRetriever(NamedTuple):
     param_name: str
     item_id_flag: ItemIDFlag
     id_min: int | None = None
     id_max: int | None = None
+    fields: tuple[str, ...] | None = None # only these fields are loaded when set
 
     def get(self, version: GameVersion) -> ParamDict:
         args = [self.param_name, version, self.item_id_flag]
         args += [arg for arg in [self.id_min, self.id_max] if arg is not None]
         func = load_params if len(args) <= 3 else load_param_ids
-        return func(*args) # type: ignore
+        return SHARED_CACHE.get(("param", str(version), *self), lambda: func(*args, fields=self.fields)) # type: ignore
+
+    def digest(self, version: GameVersion) -> str:
+        return archives.get(version).digest(f"{self.param_name}.csv")
 
     def __contains__(self, __x: object) -> bool:
         assert isinstance(__x, int), f"Can only check for integer range"
@@ -35,8 +42,11 @@ class ParamDictRetriever(NamedTuple):
 class MsgsRetriever(NamedTuple):
     file_name: str
 
-    def get(self, version: GameVersion) -> dict[int, str]:
-        return load_msg(self.file_name, version)
+    def get(self, version: GameVersion) -> Mapping[int, str]:
+        return SHARED_CACHE.get(("msg", str(version), self.file_name), lambda: load_msg(self.file_name, version))
+
+    def digest(self, version: GameVersion) -> str:
+        return archives.get(version).digest(f"{self.file_name}.fmg.xml")
 
 class ShopRetriever(NamedTuple):
     shop_lineup_id_min: int | None
@@ -45,13 +55,23 @@ class ShopRetriever(NamedTuple):
     material_set_id_max: int | None
     recipe: bool = False
 
-    def get(self, version: GameVersion) -> Lookup:
+    def _param_retrievers(self) -> tuple[ParamDictRetriever, ParamDictRetriever]:
         F = ParamDictRetriever
         shop_param = "ShopLineupParam_Recipe" if self.recipe else "ShopLineupParam"
         shop = F(shop_param, ItemIDFlag.NON_EQUIPABBLE, self.shop_lineup_id_min, self.shop_lineup_id_max)
         mats = F("EquipMtrlSetParam", ItemIDFlag.NON_EQUIPABBLE, self.material_set_id_min, self.material_set_id_max)
+        return shop, mats
+
+    def get(self, version: GameVersion) -> Lookup:
+        shop, mats = self._param_retrievers()
         return Lookup(shop.get(version), mats.get(version))
 
+    def digest(self, version: GameVersion) -> str:
+        return ":".join(retriever.digest(version) for retriever in self._param_retrievers())
+
 class ContribRetriever(NamedTuple):
     def get(self, element_name: str, version: GameVersion) -> dict[str, dict]:
-        return load_contrib(element_name, version)
\ No newline at end of file
+        return load_contrib(element_name, version)
+
+    def digest(self, element_name: str, version: GameVersion) -> str:
+        return contrib_digest(element_name)
\ No newline at end of file
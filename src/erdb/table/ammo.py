@@ -8,7 +8,7 @@ from erdb.typing.api_version import ApiVersion
 from erdb.utils.common import remove_nulls
 from erdb.effect_parser import parse_status_effects, parse_weapon_effects
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext
 
 
 _BEHAVIOR_EFFECTS_FIELDS: list[str] = ["spEffectBehaviorId0", "spEffectBehaviorId1", "spEffectBehaviorId2"]
@@ -33,7 +33,7 @@ class AmmoTableSpec(TableSpecContext):
     main_param_retriever = ParamDictRetriever("EquipParamWeapon", ItemIDFlag.WEAPONS)
 
     predicates: list[RowPredicate] = [
-        lambda row: 1 <= row["sortId"].as_int < 9999999,
+        FieldPredicate.int_range("sortId", 1, 9999999),
         lambda row: AmmoCategory.get(row) is not None,
     ]
 
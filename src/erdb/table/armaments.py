@@ -8,7 +8,7 @@ from erdb.typing.api_version import ApiVersion
 from erdb.utils.common import find_offset_indices, remove_nulls
 from erdb.effect_parser import parse_effects, parse_status_effects, parse_weapon_effects
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext
 
 
 _BEHAVIOR_EFFECTS_FIELDS: list[str] = ["spEffectBehaviorId0", "spEffectBehaviorId1", "spEffectBehaviorId2"]
@@ -102,7 +102,15 @@ def _get_resistances(row: ParamRow) -> StatusEffects:
 
     return StatusEffects(**remove_nulls(data))
 
-def get_status_effect_overlay(row: ParamRow, effects: ParamDict, reinforces: ParamDict, reinforcement_id: int) -> list[StatusEffects]:
+def get_status_effect_overlay(row: ParamRow, data: RetrieverData, reinforcement_id: int) -> list[StatusEffects]:
+    """
+    Status effects of every upgrade level of an armament. Only depend on the behavior
+    effect and the reinforcement, which many armaments share, so every combination is
+    parsed once per version and the resulting objects are shared between armaments.
+    """
+    effects = data.params["effects"]
+    reinforces = data.params["reinforces"]
+
     if (reinforcement := reinforces.get(reinforcement_id + 1)) is None:
         return []
 
@@ -122,10 +130,15 @@ def get_status_effect_overlay(row: ParamRow, effects: ParamDict, reinforces: Par
         "spEffectId3": "spEffectBehaviorId2",
     }[effect_fields[0]]
 
-    effect_ids = [row[weapfield].as_int + offset for offset in range(0, 26)]
-    return [parse_status_effects([i], effects) for i in effect_ids]
+    behavior_effect_id = row[weapfield].as_int
+
+    def parse() -> tuple[StatusEffects, ...]:
+        return tuple(parse_status_effects([behavior_effect_id + offset], effects) for offset in range(0, 26))
+
+    return list(TableSpecContext.memoize(data, ("status effect overlay", behavior_effect_id, reinforcement_id), parse))
 
-def _get_affinity_properties(row: ParamRow, effects: ParamDict, reinforces: ParamDict) -> AffinityProperties:
+def _get_affinity_properties(row: ParamRow, data: RetrieverData) -> AffinityProperties:
+    effects = data.params["effects"]
     reinforcement_id = row["reinforceTypeId"].as_int
     return AffinityProperties(
         full_hex_id=row.index_hex,
@@ -138,14 +151,15 @@ def _get_affinity_properties(row: ParamRow, effects: ParamDict, reinforces: Para
         guard=_get_guards(row),
         resistance=_get_resistances(row),
         status_effects=parse_status_effects([row[f].as_int for f in _BEHAVIOR_EFFECTS_FIELDS], effects),
-        status_effect_overlay=get_status_effect_overlay(row, effects, reinforces, reinforcement_id),
+        status_effect_overlay=get_status_effect_overlay(row, data, reinforcement_id),
     )
 
-def _get_affinities(row: ParamRow, armaments: ParamDict, effects: ParamDict, reinforces: ParamDict, allow_ash_of_war: bool) -> dict[Affinity, AffinityProperties]:
+def _get_affinities(row: ParamRow, data: RetrieverData, allow_ash_of_war: bool) -> dict[Affinity, AffinityProperties]:
+    armaments = data.main_param
     possible_maxima = [0, 12] if allow_ash_of_war else [0]
     indices, levels = find_offset_indices(row.index, armaments, possible_maxima, increment=100)
     affinities: list[Affinity] = [Affinity.from_id(round(l / 100)) for l in levels]
-    return {a: _get_affinity_properties(armaments[i], effects, reinforces) for i, a in zip(indices, affinities)}
+    return {a: _get_affinity_properties(armaments[i], data) for i, a in zip(indices, affinities)}
 
 class ArmamentTableSpec(TableSpecContext):
     model = {
@@ -155,8 +169,8 @@ class ArmamentTableSpec(TableSpecContext):
     main_param_retriever = ParamDictRetriever("EquipParamWeapon", ItemIDFlag.WEAPONS, id_min=1000000, id_max=49000000)
 
     predicates: list[RowPredicate] = [
-        lambda row: row.index % 10000 == 0,
-        lambda row: len(row.name) > 0,
+        FieldPredicate("Row ID", lambda v: v.as_int % 10000 == 0),
+        FieldPredicate.name(lambda name: len(name) > 0),
     ]
 
     param_retrievers = {
@@ -203,5 +217,5 @@ class ArmamentTableSpec(TableSpecContext):
             sp_consumption_rate=row["staminaConsumptionRate"].as_float,
             requirements=_get_requirements(row),
             effects=[Effect(**eff) for eff in weapon_effects],
-            affinity=_get_affinities(row, data.main_param, effects, reinforces, allow_ash_of_war)
+            affinity=_get_affinities(row, data, allow_ash_of_war)
         )
\ No newline at end of file
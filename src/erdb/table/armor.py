@@ -7,7 +7,7 @@ from erdb.typing.categories import ArmorCategory
 from erdb.typing.api_version import ApiVersion
 from erdb.effect_parser import parse_effects
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData, ShopRetriever
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext
 
 
 def _get_absorptions(row: ParamRow) -> Absorptions:
@@ -47,8 +47,8 @@ class ArmorTableSpec(TableSpecContext):
     main_param_retriever = ParamDictRetriever("EquipParamProtector", ItemIDFlag.PROTECTORS)
 
     predicates: list[RowPredicate] = [
-        lambda row: row.index >= 40000,
-        lambda row: len(row.name) > 0,
+        FieldPredicate("Row ID", lambda v: v.as_int >= 40000),
+        FieldPredicate.name(lambda name: len(name) > 0),
     ]
 
     param_retrievers = {
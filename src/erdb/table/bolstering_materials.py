@@ -4,7 +4,7 @@ from erdb.typing.params import ParamRow
 from erdb.typing.enums import GoodsType, ItemIDFlag
 from erdb.typing.api_version import ApiVersion
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext, ITEM_FIELDS
 
 
 class BolsteringMaterialTableSpec(TableSpecContext):
@@ -13,10 +13,11 @@ class BolsteringMaterialTableSpec(TableSpecContext):
     }
 
     predicates: list[RowPredicate] = [
-        lambda row: row["goodsType"] == GoodsType.REINFORCEMENT_MATERIAL,
+        FieldPredicate.equals("goodsType", GoodsType.REINFORCEMENT_MATERIAL),
     ]
 
-    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS)
+    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS,
+        fields=("goodsType", "sortGroupId", *ITEM_FIELDS))
 
     msg_retrievers = {
         "names": MsgsRetriever("GoodsName"),
@@ -6,7 +6,7 @@ from erdb.typing.params import ParamRow
 from erdb.typing.enums import ItemIDFlag
 from erdb.typing.api_version import ApiVersion
 from erdb.table._retrievers import ParamDictRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext
 
 
 def calc_output(stage_min: float, stage_max: float, val_min: float, val_max: float, mult_val_min: float, mult_val_max: float, input_val: float) -> float:
@@ -58,7 +58,7 @@ class CorrectionGraphTableSpec(TableSpecContext):
     main_param_retriever = ParamDictRetriever("CalcCorrectGraph", ItemIDFlag.NON_EQUIPABBLE)
 
     predicates: list[RowPredicate] = [
-        lambda row: row.index < 17
+        FieldPredicate("Row ID", lambda v: v.as_int < 17),
     ]
 
     @classmethod # override
@@ -6,7 +6,7 @@ from erdb.typing.enums import GoodsType, ItemIDFlag
 from erdb.typing.categories import CraftingMaterialCategory
 from erdb.typing.api_version import ApiVersion
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData, ShopRetriever
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext, ITEM_FIELDS
 
 
 class CraftingMaterialTableSpec(TableSpecContext):
@@ -14,10 +14,11 @@ class CraftingMaterialTableSpec(TableSpecContext):
         ApiVersion.VER_1: CraftingMaterial,
     }
 
-    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS)
+    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS,
+        fields=("goodsType", "sortGroupId", *ITEM_FIELDS))
 
     predicates: list[RowPredicate] = [
-        lambda row: row["goodsType"] == GoodsType.CRAFTING_MATERIAL
+        FieldPredicate.equals("goodsType", GoodsType.CRAFTING_MATERIAL),
     ]
 
     msg_retrievers = {
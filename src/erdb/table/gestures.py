@@ -3,7 +3,7 @@ from erdb.typing.params import ParamRow
 from erdb.typing.enums import GoodsSortGroupID, ItemIDFlag
 from erdb.typing.api_version import ApiVersion
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext, ITEM_FIELDS
 
 
 class GestureTableSpec(TableSpecContext):
@@ -12,10 +12,11 @@ class GestureTableSpec(TableSpecContext):
     }
 
     predicates: list[RowPredicate] = [
-        lambda row: row["sortGroupId"].as_int == GoodsSortGroupID.GESTURES,
+        FieldPredicate.int_one_of("sortGroupId", [GoodsSortGroupID.GESTURES]),
     ]
 
-    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS)
+    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS,
+        fields=("sortGroupId", *ITEM_FIELDS))
 
     msg_retrievers = {
         "names": MsgsRetriever("GoodsName"),
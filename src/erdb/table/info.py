@@ -4,7 +4,7 @@ from erdb.typing.enums import GoodsType, ItemIDFlag
 from erdb.typing.categories import InfoCategory
 from erdb.typing.api_version import ApiVersion
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext, ITEM_FIELDS
 
 
 class InfoTableSpec(TableSpecContext):
@@ -12,11 +12,12 @@ class InfoTableSpec(TableSpecContext):
         ApiVersion.VER_1: Info,
     }
 
-    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS)
+    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS,
+        fields=("sortId", "goodsType", "sortGroupId", *ITEM_FIELDS))
 
     predicates: list[RowPredicate] = [
-        lambda row: 1 <= row["sortId"].as_int < 999999,
-        lambda row: row["goodsType"] == GoodsType.INFO_ITEM,
+        FieldPredicate.int_range("sortId", 1, 999999),
+        FieldPredicate.equals("goodsType", GoodsType.INFO_ITEM),
     ]
 
     msg_retrievers = {
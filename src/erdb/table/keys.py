@@ -4,7 +4,7 @@ from erdb.typing.enums import GoodsSortGroupID, GoodsType, ItemIDFlag
 from erdb.typing.categories import KeyCategory
 from erdb.typing.api_version import ApiVersion
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext, ITEM_FIELDS
 
 
 class KeyTableSpec(TableSpecContext):
@@ -12,13 +12,14 @@ class KeyTableSpec(TableSpecContext):
         ApiVersion.VER_1: Key,
     }
 
-    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS)
+    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS,
+        fields=("sortId", "goodsType", "sortGroupId", "isConsume", *ITEM_FIELDS))
 
     predicates: list[RowPredicate] = [
-        lambda row: 1 <= row["sortId"].as_int < 999999,
-        lambda row: row["goodsType"] in [GoodsType.KEY_ITEM, GoodsType.REGENERATIVE_MATERIAL],
-        lambda row: row["sortGroupId"].as_int not in [GoodsSortGroupID.GROUP_8, GoodsSortGroupID.GROUP_9, GoodsSortGroupID.GROUP_10],
-        lambda row: "Cookbook" not in row.name,
+        FieldPredicate.int_range("sortId", 1, 999999),
+        FieldPredicate.one_of("goodsType", [GoodsType.KEY_ITEM, GoodsType.REGENERATIVE_MATERIAL]),
+        FieldPredicate.int_one_of("sortGroupId", [GoodsSortGroupID.GROUP_8, GoodsSortGroupID.GROUP_9, GoodsSortGroupID.GROUP_10]).negate(),
+        FieldPredicate.name(lambda name: "Cookbook" not in name),
     ]
 
     msg_retrievers = {
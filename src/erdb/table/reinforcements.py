@@ -4,7 +4,7 @@ from erdb.typing.enums import ItemIDFlag
 from erdb.typing.api_version import ApiVersion
 from erdb.utils.common import find_offset_indices
 from erdb.table._retrievers import ParamDictRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext
 
 
 def _get_damages(row: ParamRow) -> DamageMultiplier:
@@ -65,7 +65,7 @@ class ReinforcementTableSpec(TableSpecContext):
 
     predicates: list[RowPredicate] = [
         lambda row: row.is_base_item,
-        lambda row: len(row.name) > 0,
+        FieldPredicate.name(lambda name: len(name) > 0),
     ]
 
     @classmethod # override
@@ -4,7 +4,7 @@ from erdb.typing.enums import GoodsSortGroupID, GoodsType, ItemIDFlag
 from erdb.typing.categories import ShopCategory
 from erdb.typing.api_version import ApiVersion
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext, ITEM_FIELDS
 
 
 class ShopTableSpec(TableSpecContext):
@@ -12,11 +12,12 @@ class ShopTableSpec(TableSpecContext):
         ApiVersion.VER_1: Shop,
     }
 
-    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS)
+    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS,
+        fields=("sortId", "goodsType", "sortGroupId", *ITEM_FIELDS))
 
     predicates: list[RowPredicate] = [
-        lambda row: 1 <= row["sortId"].as_int < 999999,
-        lambda row: row["goodsType"] == GoodsType.KEY_ITEM,
+        FieldPredicate.int_range("sortId", 1, 999999),
+        FieldPredicate.equals("goodsType", GoodsType.KEY_ITEM),
         lambda row: (row["sortGroupId"].as_int in [GoodsSortGroupID.GROUP_8, GoodsSortGroupID.GROUP_9, GoodsSortGroupID.GROUP_10] \
             or (row["sortGroupId"].as_int == GoodsSortGroupID.GROUP_6 and "Cookbook" in row.name)),
     ]
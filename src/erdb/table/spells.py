@@ -6,7 +6,7 @@ from erdb.typing.categories import SpellCategory
 from erdb.typing.api_version import ApiVersion
 from erdb.utils.common import remove_nulls
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext, ITEM_FIELDS
 
 
 def _get_spell_requirements(row: ParamRow) -> StatRequirements:
@@ -24,15 +24,18 @@ class SpellTableSpec(TableSpecContext):
     }
 
     # Spells are defined in Goods and Magic tables, correct full hex IDs are calculated from Goods
-    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS)
+    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS,
+        fields=("sortId", "goodsType", *ITEM_FIELDS))
 
     predicates: list[RowPredicate] = [
-        lambda row: 1 <= row["sortId"].as_int < 999999,
-        lambda row: row["goodsType"] in [GoodsType.SORCERY_1, GoodsType.INCANTATION_1, GoodsType.SORCERY_2, GoodsType.INCANTATION_2],
+        FieldPredicate.int_range("sortId", 1, 999999),
+        FieldPredicate.one_of("goodsType", [GoodsType.SORCERY_1, GoodsType.INCANTATION_1, GoodsType.SORCERY_2, GoodsType.INCANTATION_2]),
     ]
 
     param_retrievers = {
-        "magic": ParamDictRetriever("Magic", ItemIDFlag.NON_EQUIPABBLE)
+        "magic": ParamDictRetriever("Magic", ItemIDFlag.NON_EQUIPABBLE,
+            fields=("mp", "mp_charge", "stamina", "stamina_charge", "consumeLoopMP_forMenu", "ezStateBehaviorType", "slotLength",
+                    "isEnchant", "isShieldEnchant", "enableRiding", "requirementIntellect", "requirementFaith", "requirementLuck"))
     }
 
     msg_retrievers = {
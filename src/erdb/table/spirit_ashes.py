@@ -4,7 +4,7 @@ from erdb.typing.enums import GoodsType, ItemIDFlag, SpiritAshUpgradeMaterial
 from erdb.typing.api_version import ApiVersion
 from erdb.utils.common import find_offset_indices
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext, ITEM_FIELDS
 
 
 def _find_upgrade_costs(goods: ParamDict, base_item_id: int) -> list[int]:
@@ -16,11 +16,12 @@ class SpiritAshTableSpec(TableSpecContext):
         ApiVersion.VER_1: SpiritAsh,
     }
 
-    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS)
+    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS,
+        fields=("goodsType", "reinforceMaterialId", "reinforcePrice", "consumeMP", "consumeHP", *ITEM_FIELDS))
 
     predicates: list[RowPredicate] = [
         lambda row: row.is_base_item,
-        lambda row: row["goodsType"] in [GoodsType.LESSER, GoodsType.GREATER],
+        FieldPredicate.one_of("goodsType", [GoodsType.LESSER, GoodsType.GREATER]),
     ]
 
     param_retrievers = {
@@ -6,7 +6,7 @@ from erdb.typing.params import ParamRow
 from erdb.typing.enums import ItemIDFlag
 from erdb.typing.api_version import ApiVersion
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext
 
 
 class TalismanTableSpec(TableSpecContext):
@@ -17,7 +17,7 @@ class TalismanTableSpec(TableSpecContext):
     main_param_retriever = ParamDictRetriever("EquipParamAccessory", ItemIDFlag.ACCESSORIES)
 
     predicates: list[RowPredicate] = [
-        lambda row: 1000 <= row.index < 999999,
+        FieldPredicate.int_range("Row ID", 1000, 999999),
     ]
 
     param_retrievers = {
@@ -31,10 +31,9 @@ class TalismanTableSpec(TableSpecContext):
     }
 
     @classmethod
-    def _find_conflicts(cls, data: RetrieverData, group: int) -> list[NonEmptyStr]:
-        def valid(row: ParamRow) -> bool:
-            return row["accessoryGroup"].as_int == group and row.index < 9999999
-        return [NonEmptyStr(cls.parse_name(data.msgs["names"][row.index])) for row in data.main_param.values() if valid(row)]
+    def _find_conflicts(cls, data: RetrieverData, group: str) -> list[NonEmptyStr]:
+        rows = cls.group_by(data, "accessoryGroup").get(group, [])
+        return [NonEmptyStr(cls.parse_name(data.msgs["names"][row.index])) for row in rows if row.index < 9999999]
 
     @classmethod
     def make_object(cls, api: ApiVersion, data: RetrieverData, row: ParamRow):
@@ -45,5 +44,5 @@ class TalismanTableSpec(TableSpecContext):
             **cls.make_contrib(data, row, "locations", "remarks"),
             weight=row["weight"].as_float,
             effects=[Effect(**eff) for eff in parse_effects(row, effects, "refId")],
-            conflicts=cls._find_conflicts(data, row["accessoryGroup"].as_int),
+            conflicts=cls._find_conflicts(data, row["accessoryGroup"]),
         )
\ No newline at end of file
@@ -6,7 +6,7 @@ from erdb.typing.categories import ToolCategory
 from erdb.typing.api_version import ApiVersion
 from erdb.effect_parser import parse_effects
 from erdb.table._retrievers import ParamDictRetriever, MsgsRetriever, RetrieverData
-from erdb.table._common import RowPredicate, TableSpecContext
+from erdb.table._common import FieldPredicate, RowPredicate, TableSpecContext, ITEM_FIELDS
 
 
 def _get_availability(row: ParamRow) -> ToolAvailability:
@@ -26,13 +26,14 @@ class ToolTableSpec(TableSpecContext):
         ApiVersion.VER_1: Tool,
     }
 
-    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS)
+    main_param_retriever = ParamDictRetriever("EquipParamGoods", ItemIDFlag.GOODS,
+        fields=("sortId", "goodsType", "sortGroupId", "isConsume", "disable_offline", "enable_multi", "consumeMP", "enable_Ladder", "enableRiding", "refId_default", *ITEM_FIELDS))
 
     predicates: list[RowPredicate] = [
-        lambda row: 1 <= row["sortId"].as_int < 999999,
-        lambda row: row["sortGroupId"].as_int != GoodsSortGroupID.GESTURES,
-        lambda row: row["goodsType"] in [GoodsType.NORMAL_ITEM, GoodsType.REMEMBRANCE, GoodsType.WONDROUS_PHYSICK_TEAR, GoodsType.GREAT_RUNE],
-        lambda row: not _is_note_item(row.name),
+        FieldPredicate.int_range("sortId", 1, 999999),
+        FieldPredicate.int_one_of("sortGroupId", [GoodsSortGroupID.GESTURES]).negate(),
+        FieldPredicate.one_of("goodsType", [GoodsType.NORMAL_ITEM, GoodsType.REMEMBRANCE, GoodsType.WONDROUS_PHYSICK_TEAR, GoodsType.GREAT_RUNE]),
+        FieldPredicate.name(lambda name: not _is_note_item(name)),
     ]
 
     param_retrievers = {
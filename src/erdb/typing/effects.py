@@ -1,7 +1,5 @@
-from copy import deepcopy
 from enum import Enum
-from types import SimpleNamespace
-from typing import Any, Callable, NamedTuple, Self
+from typing import Any, Callable, Iterable, NamedTuple, Self
 
 
 class EffectType(str, Enum):
@@ -120,16 +118,71 @@ class AttributeField(NamedTuple):
         default_value = _default_value_from_model() if default_value is None else default_value
         return cls(attribute, effect_model, effect_type, parser, conditions, default_value)
 
-class SchemaEffect(SimpleNamespace):
+"""
+Immutable effect on a single attribute, shared between every item referencing it.
+Conditions are a tuple which clones share, and everything derived from the fields
+(hashes, the dict and string representations) is computed at most once.
+"""
+class SchemaEffect(object):
+    __slots__ = ("attribute", "conditions", "tick_interval", "effect_model", "effect_type", "value", "value_pvp",
+                 "_values_hash", "_hash", "_dict", "_str")
+
     attribute: AttributeName
-    conditions: list[str] | None = None
-    tick_interval: float | None = None
+    conditions: tuple[str, ...] | None
+    tick_interval: float | None
     effect_model: EffectModel
     effect_type: EffectType
     value: float
-    value_pvp: float | None = None
+    value_pvp: float | None
+
+    _values_hash: int
+    _hash: int
+    _dict: dict | None
+    _str: str | None
+
+    def __init__(self, attribute: AttributeName, effect_model: EffectModel, effect_type: EffectType, value: float,
+                 conditions: Iterable[str] | None = None, tick_interval: float | None = None, value_pvp: float | None = None) -> None:
+        conditions = None if conditions is None else tuple(conditions)
+        values_hash = hash((conditions, tick_interval, effect_model, effect_type, value, value_pvp))
+
+        for name, field in [
+            ("attribute", attribute), ("conditions", conditions), ("tick_interval", tick_interval),
+            ("effect_model", effect_model), ("effect_type", effect_type), ("value", value), ("value_pvp", value_pvp),
+            ("_values_hash", values_hash), ("_hash", hash((attribute, values_hash))), ("_dict", None), ("_str", None),
+        ]:
+            object.__setattr__(self, name, field)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable, use `replace` instead")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), (self.attribute, self.effect_model, self.effect_type, self.value, self.conditions, self.tick_interval, self.value_pvp))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SchemaEffect):
+            return NotImplemented
+
+        return self._hash == other._hash and self.attribute == other.attribute and self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"SchemaEffect({self})"
+
+    def _values(self) -> tuple:
+        return (self.conditions, self.tick_interval, self.effect_model, self.effect_type, self.value, self.value_pvp)
 
     def to_dict(self) -> dict:
+        """
+        Dict representation of the effect, shared between callers and must not be modified.
+        """
+        if self._dict is not None:
+            return self._dict
+
         d = {
             "attribute": self.attribute,
             "model": self.effect_model,
@@ -137,28 +190,49 @@ class SchemaEffect(SimpleNamespace):
             "value": self.value,
         }
 
-        for prop in ["conditions", "tick_interval", "value_pvp"]:
+        if self.conditions is not None:
+            d["conditions"] = list(self.conditions)
+
+        for prop in ["tick_interval", "value_pvp"]:
             if getattr(self, prop) is not None:
                 d[prop] = getattr(self, prop)
 
+        object.__setattr__(self, "_dict", d)
         return d
 
     def get_values_hash(self) -> int:
-        conds = None if self.conditions is None else tuple(self.conditions)
-        return hash((conds, self.tick_interval, self.effect_model, self.effect_type, self.value, self.value_pvp))
+        return self._values_hash
+
+    def replace(self, **fields: Any) -> Self:
+        values = {name: getattr(self, name) for name in ["attribute", "effect_model", "effect_type", "value", "conditions", "tick_interval", "value_pvp"]}
+        return type(self)(**(values | fields))
 
     def clone(self, new_attribute: AttributeName) -> Self:
-        new_effect = deepcopy(self)
-        new_effect.attribute = new_attribute
+        # every field but the attribute is shared, values hash included
+        new_effect = object.__new__(type(self))
+
+        for name in ["conditions", "tick_interval", "effect_model", "effect_type", "value", "value_pvp", "_values_hash"]:
+            object.__setattr__(new_effect, name, getattr(self, name))
+
+        object.__setattr__(new_effect, "attribute", new_attribute)
+        object.__setattr__(new_effect, "_hash", hash((new_attribute, self._values_hash)))
+        object.__setattr__(new_effect, "_dict", None)
+        object.__setattr__(new_effect, "_str", None)
+
         return new_effect
 
     def __str__(self) -> str:
-        conds      = "" if self.conditions is None else f" (under conditions {self.conditions})"
+        if self._str is not None:
+            return self._str
+
+        conds      = "" if self.conditions is None else f" (under conditions {list(self.conditions)})"
         sign_val   = "+" if self.value > 0 else "-"
         sign_model = "%" if self.effect_model == EffectModel.MULTIPLICATIVE else "+"
         val_pvp    = "" if self.value_pvp is None else f" ({self.value_pvp} PVP)"
         tick       = "" if self.tick_interval is None else f" on tick {self.tick_interval} s"
-        return f"{sign_val}{self.value}{sign_model}{val_pvp} {self.attribute.value}{conds}{tick}"
+
+        object.__setattr__(self, "_str", f"{sign_val}{self.value}{sign_model}{val_pvp} {self.attribute.value}{conds}{tick}")
+        return self._str # type: ignore
 
     @classmethod
     def from_attribute_field(cls, value: float, attrib_field: AttributeField) -> Self:
@@ -0,0 +1,148 @@
+"""
+Trusted construction of model dataclasses, which skips validation.
+
+Generated data is produced by our own parsers, so checking every constraint of
+every nested model is mostly redundant. Within `trusted_construction`, models
+only receive the conversions validation would have applied to them: defaults,
+nested dicts into models, enum values into members and integers into floats.
+Constraints like ranges, lengths and patterns are not checked. Any value not
+of the expected type is handed to pydantic, so results are identical to those
+of validated construction for values that pass validation.
+"""
+
+import dataclasses
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Callable, Iterable, Iterator
+
+from pydantic import ValidationError
+from pydantic.fields import FieldInfo, ModelField, SHAPE_SINGLETON, SHAPE_LIST, SHAPE_DICT
+
+
+_Converter = Callable[[Any], Any]
+
+_trusted: ContextVar[bool] = ContextVar("trusted", default=False)
+_installed: set[type] = set()
+
+def _is_model(cls: Any) -> bool:
+    return isinstance(cls, type) and dataclasses.is_dataclass(cls) and hasattr(cls, "__pydantic_model__")
+
+def _validator(model: type, field: ModelField) -> _Converter:
+    def validate(value: Any) -> Any:
+        value, error = field.validate(value, {}, loc=field.name, cls=model) # type: ignore
+        if error:
+            raise ValidationError([error], model) # type: ignore
+        return value
+
+    return validate
+
+def _exact(cls: type, validate: _Converter) -> _Converter:
+    return lambda value: value if type(value) is cls else validate(value)
+
+def _singleton(model: type, field: ModelField, validate: _Converter) -> _Converter:
+    cls = field.type_
+
+    if field.sub_fields or not isinstance(cls, type):
+        return validate # unions, literals and the like
+
+    if _is_model(cls):
+        return lambda value: value if isinstance(value, cls) else cls(**value) if type(value) is dict else validate(value)
+
+    if issubclass(cls, Enum):
+        return lambda value: value if isinstance(value, cls) else cls(value)
+
+    if issubclass(cls, bool):
+        return _exact(bool, validate)
+
+    if issubclass(cls, int):
+        return _exact(int, validate)
+
+    if issubclass(cls, float):
+        return lambda value: value if type(value) is float else float(value) if type(value) is int else validate(value)
+
+    if issubclass(cls, str) and not any(getattr(cls, attr, False) for attr in ("strip_whitespace", "to_upper", "to_lower")):
+        return _exact(str, validate)
+
+    return validate
+
+def _converter(model: type, field: ModelField) -> _Converter:
+    validate = _validator(model, field)
+
+    if field.shape == SHAPE_SINGLETON:
+        convert = _singleton(model, field, validate)
+
+    elif field.shape == SHAPE_LIST:
+        item = _converter(model, field.sub_fields[0]) # type: ignore
+        convert = lambda value: [item(v) for v in value] if type(value) is list else validate(value)
+
+    elif field.shape == SHAPE_DICT:
+        key, item = _converter(model, field.key_field), _converter(model, field.sub_fields[0]) # type: ignore
+        convert = lambda value: {key(k): item(v) for k, v in value.items()} if type(value) is dict else validate(value)
+
+    else:
+        convert = validate
+
+    if field.allow_none:
+        return lambda value: None if value is None else convert(value)
+
+    return convert
+
+def _install(model: type):
+    fields: dict[str, ModelField] = model.__pydantic_model__.__fields__ # type: ignore
+    converters = [(name, field, _converter(model, field)) for name, field in fields.items()]
+    validate_values = model.__pydantic_validate_values__ # type: ignore
+
+    def trusted_validate_values(self: Any):
+        # subclasses which were not installed inherit this, but have other fields
+        if not _trusted.get() or type(self) is not model:
+            return validate_values(self)
+
+        if self.__pydantic_initialised__:
+            return
+
+        values = self.__dict__
+
+        for name, field, convert in converters:
+            if not isinstance(value := values[name], FieldInfo):
+                values[name] = convert(value)
+
+            elif field.required:
+                return validate_values(self) # reports the missing field
+
+            else:
+                values[name] = field.get_default()
+
+        object.__setattr__(self, "__pydantic_initialised__", True)
+
+    model.__pydantic_validate_values__ = trusted_validate_values # type: ignore
+    _installed.add(model)
+
+def install(models: Iterable[type]):
+    """
+    Enable trusted construction of models and all models nested within them.
+    """
+    pending = [m for m in models if _is_model(m)]
+
+    while len(pending) > 0:
+        if (model := pending.pop()) in _installed:
+            continue
+
+        _install(model)
+
+        for field in model.__pydantic_model__.__fields__.values(): # type: ignore
+            nested = [field, *(field.sub_fields or []), *([field.key_field] if field.key_field else [])]
+            pending += [f.type_ for f in nested if _is_model(f.type_)]
+
+@contextmanager
+def trusted_construction(models: Iterable[type]) -> Iterator[None]:
+    """
+    Construct the given models and models nested within them without validation.
+    """
+    install(models)
+    token = _trusted.set(True)
+
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
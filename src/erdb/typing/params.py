@@ -1,21 +1,27 @@
-from typing import Any, NamedTuple, Self, overload
+from functools import cached_property
+from itertools import compress
+from typing import Any, Callable, Iterable, Protocol, Self, Sequence, overload
 from erdb.typing.enums import ItemIDFlag
 
 
 class ParamField(str):
+    """
+    Textual value of a param field. Numeric conversions are cached, compiled params
+    share field instances between rows and pre-decode them for numeric columns.
+    """
     @property
     def as_str(self) -> str:
         return self
 
-    @property
+    @cached_property
     def as_int(self) -> int:
         return int(self)
 
-    @property
+    @cached_property
     def as_bool(self) -> bool:
         return self != "0"
 
-    @property
+    @cached_property
     def as_float(self) -> float:
         return float(self)
 
@@ -26,7 +32,7 @@ class ParamField(str):
     def get_int(self, default: int | None = None, null_value: Any = "-1", formatter = lambda x: x) -> int | None: ...
 
     def get_int(self, default: int | None = None, null_value: Any = "-1", formatter = lambda x: x) -> int | None:
-        return default if self == str(null_value) else formatter(int(self))
+        return default if self == str(null_value) else formatter(self.as_int)
 
     @overload
     def get_float(self, default: float, null_value: Any = "-1", formatter = lambda x: x) -> float: ...
@@ -35,13 +41,83 @@ class ParamField(str):
     def get_float(self, default: float | None = None, null_value: Any = "-1", formatter = lambda x: x) -> float | None: ...
 
     def get_float(self, default: float | None = None, null_value: Any = "-1", formatter = lambda x: x) -> float | None:
-        return default if self == str(null_value) else formatter(float(self))
+        return default if self == str(null_value) else formatter(self.as_float)
+
+    @classmethod
+    def from_int(cls, value: int) -> Self:
+        field = cls(value)
+        field.__dict__.update(as_int=value, as_float=float(value))
+        return field
+
+    @classmethod
+    def from_float(cls, text: str, value: float) -> Self:
+        field = cls(text)
+        field.__dict__["as_float"] = value
+        return field
+
+class ParamFields(Protocol):
+    """
+    Shared, per-param storage of field values which rows index into.
+    """
+    header: list[str]
+    source: Any # identifies the data the storage was built from, None if unknown
+
+    def __contains__(self, __x: object) -> bool: ...
+
+    def field(self, name: str, position: int) -> ParamField: ...
+
+    def select(self, name: str, test: Callable[[ParamField], bool]) -> Sequence[bool] | None:
+        """
+        Evaluate `test` over a whole column, returning its result for every
+        position, or None if the storage cannot evaluate columns at once.
+        """
+        ...
+
+class _DictFields(object):
+    __slots__ = ("field_dict",)
+
+    field_dict: dict[str, str]
+
+    def __init__(self, field_dict: dict[str, str]) -> None:
+        self.field_dict = field_dict
+
+    @property
+    def header(self) -> list[str]:
+        return list(self.field_dict.keys())
+
+    @property
+    def source(self) -> Any:
+        return None
+
+    def __contains__(self, __x: object) -> bool:
+        return __x in self.field_dict
+
+    def field(self, name: str, position: int) -> ParamField:
+        return ParamField(self.field_dict[name])
+
+    def select(self, name: str, test: Callable[[ParamField], bool]) -> Sequence[bool] | None:
+        return None
+
+class ParamRow(object):
+    """
+    Single row of a param. Field values are not stored on the row, they are
+    decoded from the param's shared storage only when accessed.
+    """
+    __slots__ = ("index", "item_id_flag", "name", "_fields", "_position")
 
-class ParamRow(NamedTuple):
     index: int
     item_id_flag: ItemIDFlag
     name: str
-    field_dict: dict[str, str]
+
+    _fields: ParamFields
+    _position: int
+
+    def __init__(self, index: int, item_id_flag: ItemIDFlag, name: str, fields: ParamFields, position: int = 0) -> None:
+        self.index = index
+        self.item_id_flag = item_id_flag
+        self.name = name
+        self._fields = fields
+        self._position = position
 
     @property
     def index_hex(self) -> str:
@@ -55,21 +131,81 @@ class ParamRow(NamedTuple):
         """
         return self.index % 100 == 0
 
+    @property
+    def field_dict(self) -> dict[str, str]:
+        """
+        Materialize all fields of the row, prefer indexing the row directly.
+        """
+        return {name: self._fields.field(name, self._position) for name in self._fields.header}
+
     def __getitem__(self, key: str) -> ParamField:
-        assert key in self.field_dict, f"\"{key}\" not found"
-        return ParamField(self.field_dict[key])
+        assert key in self._fields, f"\"{key}\" not found"
+        return self._fields.field(key, self._position)
 
     def __contains__(self, __x: object) -> bool:
-        return __x in self.field_dict
+        return __x in self._fields
+
+    def __repr__(self) -> str:
+        return f"ParamRow(index={self.index}, name={self.name!r})"
 
     @classmethod
     def make(cls, field_dict: dict[str, str], item_id_flag: ItemIDFlag) -> Self:
-        index = int(field_dict["Row ID"])
-        return cls(
-            index=index,
-            item_id_flag=item_id_flag,
-            name=field_dict["Row Name"],
-            field_dict=field_dict,
-        )
-
-ParamDict = dict[int, ParamRow]
\ No newline at end of file
+        return cls(int(field_dict["Row ID"]), item_id_flag, field_dict["Row Name"], _DictFields(field_dict))
+
+ParamDict = dict[int, ParamRow]
+
+def select_rows(rows: Iterable[ParamRow], name: str, test: Callable[[ParamField], bool]) -> list[ParamRow]:
+    """
+    Keep rows whose field passes `test`, "Row Name" tests the row's name.
+    Rows sharing a storage which can evaluate whole columns are filtered by
+    a single mask, for which `test` is run once per unique value of the column.
+    """
+    rows = list(rows)
+    storages = {id(row._fields): row._fields for row in rows}
+
+    if len(storages) == 1 and (mask := next(iter(storages.values())).select(name, test)) is not None:
+        return [row for row in rows if mask[row._position]]
+
+    if name == "Row Name":
+        return [row for row in rows if test(ParamField(row.name))]
+
+    return [row for row in rows if test(row[name])]
+
+
+def param_source(rows: ParamDict) -> Any:
+    """
+    Source of the storage shared by all rows of a param, None if there is none.
+    """
+    storages = {id(row._fields): row._fields for row in rows.values()}
+    return next(iter(storages.values())).source if len(storages) == 1 else None
+
+def sparse_fields(rows: ParamDict, tests: dict[str, Callable[[ParamField], bool]]) -> dict[int, tuple[str, ...]]:
+    """
+    Names of fields passing their test for every row ID, in the order of `tests`.
+    Rows without any such field are omitted. Rows sharing a storage which can
+    evaluate whole columns are processed a column at a time, running each test
+    once per unique value and visiting only the positions which pass.
+    """
+    storages = {id(row._fields): row._fields for row in rows.values()}
+    masks = None
+
+    if len(storages) == 1:
+        storage = next(iter(storages.values()))
+        masks = [storage.select(name, test) for name, test in tests.items()]
+
+    sparse: dict[int, list[str]] = dict()
+
+    if masks is not None and all(mask is not None for mask in masks):
+        indices = {row._position: index for index, row in rows.items()}
+
+        for name, mask in zip(tests.keys(), masks):
+            for position in compress(range(len(mask)), mask): # type: ignore
+                if (index := indices.get(position)) is not None:
+                    sparse.setdefault(index, []).append(name)
+
+    else:
+        for index, row in rows.items():
+            if names := [name for name, test in tests.items() if test(row[name])]:
+                sparse[index] = names
+
+    return {index: tuple(names) for index, names in sparse.items()}
@@ -211,11 +211,15 @@ def generate(from_version: GameVersion, version: GameVersion, out: Path | None,
     formatter = FormatterBase.create(formatter_id)
     print(f"Generating changelog from {from_version} to {version}...", flush=True)
 
-    for tb in sorted(Table.effective()):
+    tables = sorted(Table.effective())
+    new_generators = Table.make_generators(tables, version)
+    old_generators = Table.make_generators(tables, from_version)
+
+    for tb, new_gen, old_gen in zip(tables, new_generators, old_generators):
         print(f"Generating changelog for {tb}...", flush=True)
 
-        new_data = tb.make_generator(version).generate()
-        old_data = tb.make_generator(from_version).generate()
+        new_data = new_gen.generate()
+        old_data = old_gen.generate()
 
         added, removed, item_changes = _get_item_changes(old_data, new_data)
 
@@ -0,0 +1,144 @@
+"""
+Serialization of generated tables into JSON.
+
+Values are converted to plain JSON types by encoders compiled once per class:
+dataclass models get a function reading their fields directly and dropping
+None values, instead of `dataclasses.asdict` followed by a recursive pass of
+`remove_nulls` for every item. The output is identical to `json.dump` with
+`pydantic_encoder_no_nulls`. Minimized output is serialized by orjson if it
+is installed, falling back to the standard library for items containing values
+orjson formats differently. Indented output always uses the standard library.
+"""
+
+import json
+import math
+import dataclasses
+from enum import Enum
+from typing import IO, Any, Callable, Iterable
+from pydantic.json import pydantic_encoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_Encoder = Callable[[Any], Any]
+
+_ENCODERS: dict[type, _Encoder] = dict()
+
+def _identity(value: Any) -> Any:
+    return value
+
+class _ExponentFloat(float):
+    """
+    Float which the standard library formats in exponent notation, like `1e-05`.
+    orjson formats these differently, and being unsupported by it, forces the
+    item to be serialized by the standard library instead.
+    """
+
+def _encode_float(value: float) -> float:
+    if not math.isfinite(value):
+        raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+
+    if value != 0 and not 1e-3 <= abs(value) < 1e15 and "e" in repr(value):
+        return _ExponentFloat(value)
+
+    return value
+
+def _encode_list(value: list) -> list:
+    return [to_jsonable(v) for v in value if v is not None]
+
+def _encode_tuple(value: tuple) -> list:
+    # not filtered, `remove_nulls` does not descend into tuples either
+    return [to_jsonable(v) for v in value]
+
+def _encode_dict(value: dict) -> dict:
+    return {k: to_jsonable(v) for k, v in value.items() if v is not None}
+
+def _encode_enum(value: Enum) -> Any:
+    return to_jsonable(value.value)
+
+def _encode_other(value: Any) -> Any:
+    return to_jsonable(pydantic_encoder(value))
+
+def _compile_dataclass(cls: type) -> _Encoder:
+    names = [field.name for field in dataclasses.fields(cls)]
+
+    def encode(obj: Any) -> dict:
+        ret = dict()
+        for name in names:
+            if (value := getattr(obj, name)) is not None:
+                ret[name] = to_jsonable(value)
+        return ret
+
+    return encode
+
+def _compile(cls: type) -> _Encoder:
+    if dataclasses.is_dataclass(cls):
+        return _compile_dataclass(cls)
+
+    # order matters, enums may derive from the primitive types
+    if issubclass(cls, Enum):
+        return _encode_enum
+
+    if issubclass(cls, bool) or issubclass(cls, int) or issubclass(cls, str):
+        return _identity
+
+    if issubclass(cls, float):
+        return _encode_float
+
+    if issubclass(cls, list):
+        return _encode_list
+
+    if issubclass(cls, tuple):
+        return _encode_tuple
+
+    if issubclass(cls, dict):
+        return _encode_dict
+
+    return _encode_other
+
+def to_jsonable(value: Any) -> Any:
+    """
+    Convert a value into plain JSON types with all None values removed.
+    """
+    if (encoder := _ENCODERS.get(type(value))) is None:
+        encoder = _ENCODERS[type(value)] = _compile(type(value))
+
+    return encoder(value)
+
+def _dumps_minimized(value: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+def _dumps_indented(value: Any) -> str:
+    # every item is nested one level deep within the table object
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, indent=4).replace("\n", "\n    ")
+
+def write_table(items: Iterable[tuple[str, Any]], f: IO[str], minimize: bool) -> int:
+    """
+    Write (pk, item) pairs as a JSON object, returning the number of items.
+    Every item is written as soon as it is serialized, so keys must be unique.
+    """
+    dumps = _dumps_minimized if minimize else _dumps_indented
+    separator = ":" if minimize else ": "
+    opening, delimiter, closing = ("{", ",", "}") if minimize else ("{\n    ", ",\n    ", "\n}")
+
+    keys: set[str] = set()
+
+    for key, item in items:
+        if key in keys:
+            raise ValueError(f"Repeated key \"{key}\" in table")
+
+        f.write((delimiter if len(keys) > 0 else opening) + dumps(key) + separator + dumps(to_jsonable(item)))
+        keys.add(key)
+
+    f.write(closing if len(keys) > 0 else "{}")
+
+    return len(keys)
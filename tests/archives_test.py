@@ -0,0 +1,39 @@
+import os
+import pytest
+
+from erdb.loaders import archives
+from erdb.typing.game_version import GameVersion
+
+
+def _ver(string: str) -> GameVersion:
+    return GameVersion.from_string(string)
+
+def test_identical_versions_share_blobs():
+    assert archives.changed_members(_ver("1.02.1"), _ver("1.02.2")) == []
+
+def test_changed_members():
+    changed = archives.changed_members(_ver("1.09.0"), _ver("1.10.0"))
+    assert "EquipParamWeapon.csv" in changed
+    assert "EquipParamGoods.csv" not in changed
+
+def test_read_member():
+    archive = archives.get(_ver("1.10.0"))
+    assert archive.read("EquipParamGoods.csv").startswith(b"Row ID;Row Name;")
+    assert archives.get(_ver("1.10.0")) is archive
+
+def test_interrupted_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(archives, "STORE_VERSIONS_PATH", tmp_path / "versions")
+    monkeypatch.setattr(archives, "STORE_BLOBS_PATH", tmp_path / "blobs")
+
+    def replace(src, dst):
+        raise KeyboardInterrupt()
+
+    # interrupted after the data was written, before it was moved into place
+    monkeypatch.setattr(os, "replace", replace)
+
+    with pytest.raises(KeyboardInterrupt):
+        archives.write_version(_ver("9.99.9"), [("EquipParamGoods.csv", b"Row ID;Row Name;\n")])
+
+    # neither a partial blob nor a manifest remains
+    assert list((tmp_path / "blobs").iterdir()) == []
+    assert not (tmp_path / "versions" / "9.99.9.json").exists()
@@ -0,0 +1,119 @@
+import io
+import csv
+import pytest
+
+from erdb.loaders.columnar import ColumnarParam
+
+
+_ROWS = [
+    ["Row ID", "Row Name", "value", "rate"],
+    ["10", "First", "0", "1", ""],
+    ["20", "Second", "-1", "0.5", ""],
+    ["30", "Third", "0", "1", ""],
+    ["40", "Fourth", "300"],
+]
+
+@pytest.fixture(scope="module")
+def param() -> ColumnarParam:
+    return ColumnarParam(ColumnarParam.compile(_ROWS, source=["test", 1]))
+
+def test_header(param: ColumnarParam):
+    assert param.header == _ROWS[0]
+    assert param.row_count == len(_ROWS) - 1
+    assert param.source == ["test", 1]
+
+def test_fields(param: ColumnarParam):
+    # short rows are padded like `csv.DictReader` pads them with None
+    expected = [row[:4] + [str(None)] * (4 - len(row)) for row in _ROWS[1:]]
+    assert [[param.field(name, i) for name in param.header] for i in range(param.row_count)] == expected
+
+def test_dictionary_encoding(param: ColumnarParam):
+    column = param.column("value")
+    assert sorted(column.values) == ["-1", "0", "300"]
+    assert list(column) == ["0", "-1", "0", "300"]
+    assert column[0] is column[2]
+
+@pytest.mark.parametrize("name,type", [
+    ("Row ID", "int"),
+    ("Row Name", "str"),
+    ("value", "int"),
+    ("rate", "str"), # contains a padded None
+])
+def test_inferred_types(param: ColumnarParam, name: str, type: str):
+    assert param.column(name).type == type
+
+def test_decoded_numbers():
+    param = ColumnarParam(ColumnarParam.compile([["Row ID", "rate"], ["1", "1"], ["2", "0.5"], ["3", "-0"]], source=None))
+    column = param.column("rate")
+
+    assert column.type == "float"
+    assert list(column) == ["1", "0.5", "-0"] # original text is preserved
+    assert [f.as_float for f in column] == [1.0, 0.5, -0.0]
+    assert column[1].get_float(null_value=0) == 0.5
+    assert column[0].get_float(default=7, null_value=1) == 7
+
+def test_blank_lines():
+    rows = list(csv.reader(io.StringIO("Row ID;Row Name;a\n\n1;x;2\n\n2;y;3\n"), delimiter=";"))
+    param = ColumnarParam(ColumnarParam.compile(rows, source=None))
+
+    assert param.row_count == 2
+    assert param.column("Row ID").type == "int"
+    assert [f.as_int for f in param.column("Row ID")] == [1, 2]
+    assert param.positions(2, 2) == [1]
+
+def test_open_stale(tmp_path):
+    path = tmp_path / "param.col"
+    path.write_bytes(ColumnarParam.compile(_ROWS, source=["test", 1]))
+
+    assert ColumnarParam.open(path, ["test", 1]) is not None
+    assert ColumnarParam.open(path, ["test", 2]) is None
+    assert ColumnarParam.open(tmp_path / "missing.col", ["test", 1]) is None
+
+def test_projection(param: ColumnarParam):
+    projected = param.project(["value", "missing"])
+    assert projected.header == ["value"]
+    assert "rate" in projected # membership still reflects the whole param
+    assert projected.field("value", 3) == "300"
+    assert projected.field("Row Name", 1) == "Second" # always readable, like Row IDs
+
+    with pytest.raises(KeyError):
+        projected.field("rate", 0)
+
+def test_row_id_index():
+    rows = [["Row ID", "Row Name"], ["30", "c"], ["10", "a"], ["20", "b"], ["10", "d"]]
+    param = ColumnarParam(ColumnarParam.compile(rows, source=None))
+
+    # positions are returned in file order, duplicates included
+    assert param.positions(10, 20) == [1, 2, 3]
+    assert param.positions(11, 29) == [2]
+    assert param.positions(40, 50) == []
+    assert param.positions(30, 30) == [0] and param.positions(25, 25) == []
+
+def test_select(param: ColumnarParam):
+    calls = []
+    def test(value):
+        calls.append(value)
+        return value.as_int == 0
+
+    assert param.select("value", test) == [True, False, True, False]
+    assert len(calls) == 3 # once per unique value
+
+    projected = param.project(["value"])
+    assert projected.select("Row Name", lambda name: name.startswith("F")) == [True, False, False, True]
+
+    with pytest.raises(KeyError):
+        projected.select("rate", lambda _: True)
+
+def test_sparse_fields(param: ColumnarParam):
+    from erdb.typing.enums import ItemIDFlag
+    from erdb.typing.params import ParamRow, sparse_fields
+
+    tests = {"value": lambda v: v != "0", "rate": lambda v: v != "1"}
+    expected = {20: ("value", "rate"), 40: ("value", "rate")}
+
+    columnar = {10 * (i + 1): ParamRow(10 * (i + 1), ItemIDFlag.DISABLE_CHECK, "", param, i) for i in range(param.row_count)}
+    assert sparse_fields(columnar, tests) == expected
+
+    # rows without columnar storage are tested one by one
+    rows = {row.index: ParamRow.make(row.field_dict, ItemIDFlag.DISABLE_CHECK) for row in columnar.values()}
+    assert sparse_fields(rows, tests) == expected
@@ -0,0 +1,60 @@
+import pytest
+
+from erdb.effect_parser.compiled import CompiledEffects, CompiledRow
+from erdb.typing.params import ParamRow
+from erdb.typing.enums import ItemIDFlag
+from erdb.typing.effects import AttributeName, EffectModel, EffectType, SchemaEffect
+
+
+def _effect(value: float, **kwargs) -> SchemaEffect:
+    return SchemaEffect(attribute=AttributeName.POISE, effect_model=EffectModel.ADDITIVE, effect_type=EffectType.POSITIVE, value=value, **kwargs)
+
+def _row(index: int) -> ParamRow:
+    return ParamRow.make({"Row ID": str(index), "Row Name": ""}, ItemIDFlag.NON_EQUIPABBLE)
+
+_ROWS = [
+    CompiledRow(10, [], [[_effect(1)], [_effect(1, conditions=["On Hit"])]]),
+    CompiledRow(20, [30], [[_effect(1.0, tick_interval=0.5)], [_effect(1.0, value_pvp=2.0)]]),
+    CompiledRow(30, [], None),
+    CompiledRow(40, [], [[], []]),
+]
+
+@pytest.fixture(scope="module")
+def table() -> CompiledEffects:
+    return CompiledEffects(CompiledEffects.compile(_ROWS, [None, "On Hit"], source=["test", 1]))
+
+def test_lookup(table: CompiledEffects):
+    sp_effects = {i: _row(i) for i in [10, 20, 30, 40]}
+
+    for row in _ROWS:
+        if row.effects is None:
+            continue
+
+        for condition, expected in zip([None, "On Hit"], row.effects):
+            effects = table.get(sp_effects[row.index], sp_effects, condition)
+            assert effects is not None and [e.to_dict() for e in effects] == [e.to_dict() for e in expected]
+
+    assert table.row_count == len(_ROWS)
+    assert table.get(_row(50), sp_effects, None) == []
+
+def test_values_kept_apart(table: CompiledEffects):
+    sp_effects = {i: _row(i) for i in [10, 20, 30]}
+    assert type(table.get(sp_effects[10], sp_effects, None)[0].value) is int # type: ignore
+    assert type(table.get(sp_effects[20], sp_effects, None)[0].value) is float # type: ignore
+
+def test_unanswered(table: CompiledEffects):
+    sp_effects = {i: _row(i) for i in [10, 20]}
+    assert table.get(sp_effects[20], sp_effects, None) is None # missing reference
+    assert table.get(_row(30), sp_effects, None) is None # failed resolution
+    assert table.get(sp_effects[10], sp_effects, "Successive Hits") is None # condition not compiled
+
+def test_peek(tmp_path):
+    path = tmp_path / "table.eff"
+    path.write_bytes(CompiledEffects.compile(_ROWS, [None, "On Hit"], source=["test", 1]))
+
+    assert CompiledEffects.peek(path, ["test", 1]) == len(_ROWS)
+    assert CompiledEffects.peek(path, ["test", 2]) is None
+    assert CompiledEffects.peek(tmp_path / "missing.eff", ["test", 1]) is None
+
+    path.write_bytes(b"truncated")
+    assert CompiledEffects.peek(path, ["test", 1]) is None
@@ -0,0 +1,56 @@
+import os
+import json
+from pathlib import Path
+import pytest
+
+from erdb.loaders import contrib
+from erdb.loaders.cache import SHARED as SHARED_CACHE
+from erdb.typing.game_version import GameVersion
+
+
+_VERSION = GameVersion.from_string("1.10.0")
+
+@pytest.fixture
+def element(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(contrib, "PKG_DATA_PATH", tmp_path / "data")
+    monkeypatch.setattr(contrib, "CACHE_PATH", tmp_path / "cache")
+
+    path = tmp_path / "data" / "contrib" / "Test"
+    path.mkdir(parents=True)
+    return path
+
+def _write(path: Path, data: dict, mtime: int):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(mtime, mtime))
+
+def _load(fresh: bool = False) -> dict[str, dict]:
+    if fresh: # as in a new process, only the persisted index remains
+        SHARED_CACHE.clear()
+    return contrib.load("Test", _VERSION)
+
+@pytest.mark.parametrize("fresh", [False, True])
+def test_rebuilt_on_change(element: Path, fresh: bool):
+    _write(element / "Lance.json", {"any version": {"value": 1}, "only 1.02.1": {"value": 2}}, 10**18)
+    assert _load(fresh) == {"Lance": {"value": 1}}
+    assert (contrib.CACHE_PATH / "contrib" / "Test.json").exists()
+
+    _write(element / "Lance.json", {"any version": {"value": 3}}, 2 * 10**18)
+    assert _load(fresh) == {"Lance": {"value": 3}}
+
+    _write(element / "Dagger.json", {"from 1.10.0": {"locations": ["here"]}}, 10**18)
+    assert _load(fresh) == {"Dagger": {"locations": ["here"]}, "Lance": {"value": 3}}
+
+    (element / "Lance.json").unlink()
+    assert _load(fresh) == {"Dagger": {"locations": ["here"]}}
+
+def test_persisted_index_reused(element: Path):
+    _write(element / "Lance.json", {"any version": {"value": 1}}, 10**18)
+    _load(fresh=True)
+
+    # an index with a matching source is read back instead of the files
+    compiled = contrib.CACHE_PATH / "contrib" / "Test.json"
+    index = json.loads(compiled.read_text(encoding="utf-8"))
+    index["overlays"][str(_VERSION)]["Lance"]["value"] = 2
+    compiled.write_text(json.dumps(index), encoding="utf-8")
+
+    assert _load(fresh=True) == {"Lance": {"value": 2}}
@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+import pytest
+
+import erdb.table
+from erdb.main.app import App
+from erdb.table import Table
+from erdb.loaders import GAME_VERSIONS
+from erdb.typing.game_version import GameVersionRange
+
+
+_TABLE = Table.GESTURES
+
+def _generate(out: Path, capsys: pytest.CaptureFixture, force: bool = False) -> bool:
+    """
+    Generate the table into `out`, returning whether it was skipped as up-to-date.
+    """
+    App.generate([_TABLE], GameVersionRange.from_version(GAME_VERSIONS[0]), True, out, 1, force, False, 0.0)
+    return "Skipping 1 up-to-date tables" in capsys.readouterr().out
+
+@pytest.fixture
+def out(tmp_path: Path, capsys: pytest.CaptureFixture) -> Path:
+    assert not _generate(tmp_path, capsys)
+    return tmp_path
+
+def _output(out: Path) -> Path:
+    return out / str(GAME_VERSIONS[0]) / f"{_TABLE}.json"
+
+def test_skip_up_to_date(out: Path, capsys: pytest.CaptureFixture):
+    assert _generate(out, capsys)
+    assert not _generate(out, capsys, force=True)
+    assert _generate(out, capsys)
+
+def test_changed_input_digest(out: Path, capsys: pytest.CaptureFixture):
+    manifest = _output(out).with_name(".manifest.json")
+    entries = json.loads(manifest.read_text())
+    entries[str(_TABLE)][0] = "outdated"
+    manifest.write_text(json.dumps(entries))
+
+    assert not _generate(out, capsys)
+    assert _generate(out, capsys)
+
+@pytest.mark.parametrize("damage", [Path.unlink, lambda path: path.write_text("")])
+def test_missing_or_truncated_output(out: Path, capsys: pytest.CaptureFixture, damage):
+    contents = _output(out).read_text()
+    damage(_output(out))
+
+    assert not _generate(out, capsys)
+    assert _output(out).read_text() == contents
+
+def test_changed_sources(out: Path, capsys: pytest.CaptureFixture, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(erdb.table, "_SOURCES", "edited")
+
+    assert not _generate(out, capsys)
+    assert _generate(out, capsys)
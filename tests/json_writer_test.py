@@ -0,0 +1,54 @@
+import io
+import json
+import pytest
+from enum import Enum
+
+from pydantic.dataclasses import dataclass
+
+from erdb.utils.common import pydantic_encoder_no_nulls
+from erdb.utils.json_writer import write_table
+
+
+class _Color(str, Enum):
+    RED = "Red"
+
+@dataclass
+class _Inner:
+    value: float
+    note: str | None = None
+
+@dataclass
+class _Outer:
+    name: str
+    color: _Color
+    inner: list[_Inner | None]
+    extra: dict[str, int | None]
+    missing: int | None = None
+
+_ITEMS = [
+    ("First", _Outer("Ünïcode \"quoted\"\n", _Color.RED, [_Inner(0.5), None], {"a": 1, "b": None})),
+    ("Second", _Outer("Second", _Color.RED, [], {})),
+    ("First", _Outer("Replaced", _Color.RED, [_Inner(1e-05, "small")], {})),
+]
+
+def _reference(minimize: bool) -> str:
+    kwargs = {"separators": (",", ":")} if minimize else {"indent": 4}
+    return json.dumps(dict(_ITEMS), ensure_ascii=False, default=pydantic_encoder_no_nulls, allow_nan=False, **kwargs)
+
+def _write(items: list, minimize: bool) -> str:
+    f = io.StringIO()
+    write_table(items, f, minimize)
+    return f.getvalue()
+
+def test_indented():
+    assert _write(list(dict(_ITEMS).items()), minimize=False) == _reference(minimize=False)
+
+def test_minimized():
+    assert _write(list(dict(_ITEMS).items()), minimize=True) == _reference(minimize=True)
+
+def test_repeated_key():
+    with pytest.raises(ValueError):
+        _write(_ITEMS, minimize=True)
+
+def test_empty():
+    assert _write([], minimize=False) == "{}"
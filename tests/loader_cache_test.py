@@ -0,0 +1,82 @@
+from threading import Event, Thread
+import pytest
+
+from erdb.loaders.cache import LoaderCache
+
+
+def test_hits_and_misses():
+    cache = LoaderCache(budget=100)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return "value"
+
+    assert cache.get("key", loader, sizeof=lambda _: 10) == "value"
+    assert cache.get("key", loader, sizeof=lambda _: 10) == "value"
+
+    stats = cache.stats()
+    assert len(loads) == 1
+    assert (stats.hits, stats.misses, stats.entries, stats.size) == (1, 1, 1, 10)
+
+def test_lru_eviction():
+    cache = LoaderCache(budget=25)
+    sizeof = lambda _: 10
+
+    cache.get("a", lambda: "a", sizeof)
+    cache.get("b", lambda: "b", sizeof)
+    cache.get("a", lambda: "a", sizeof) # "b" is now least recently used
+    cache.get("c", lambda: "c", sizeof)
+
+    stats = cache.stats()
+    assert (stats.evictions, stats.entries, stats.size) == (1, 2, 20)
+
+    cache.get("a", lambda: "a", sizeof)
+    assert cache.stats().misses == 3
+
+    cache.get("b", lambda: "b", sizeof)
+    assert cache.stats().misses == 4
+
+def test_oversized_entry_is_kept():
+    cache = LoaderCache(budget=5)
+    assert cache.get("big", lambda: "big", lambda _: 10) == "big"
+    assert cache.stats().entries == 1
+
+def test_load_outside_of_lock():
+    cache = LoaderCache(budget=100)
+    cache.get("cached", lambda: "cached", lambda _: 10)
+
+    loading, release = Event(), Event()
+    loads = []
+
+    def slow_loader():
+        loads.append(1)
+        loading.set()
+        assert release.wait(timeout=10)
+        return "slow"
+
+    threads = [Thread(target=cache.get, args=("slow", slow_loader)) for _ in range(2)]
+    threads[0].start()
+    assert loading.wait(timeout=10)
+    threads[1].start()
+
+    # another key is served while "slow" is still loading
+    assert cache.get("cached", lambda: "reloaded") == "cached"
+
+    release.set()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert len(loads) == 1
+    assert cache.get("slow", slow_loader) == "slow"
+
+def test_failed_load_is_retried():
+    cache = LoaderCache(budget=100)
+
+    def failing_loader():
+        raise OSError()
+
+    with pytest.raises(OSError):
+        cache.get("key", failing_loader)
+
+    assert cache.get("key", lambda: "value") == "value"
@@ -0,0 +1,25 @@
+import pytest
+
+from erdb.loaders.messages import MessageStore
+
+
+_ENTRIES = [(300, "Third"), (100, "First"), (200, "Ünïcode"), (100, "Replaced"), (400, "")]
+
+@pytest.fixture(scope="module")
+def store() -> MessageStore:
+    return MessageStore(MessageStore.compile(_ENTRIES, source=["test", 1]))
+
+def test_lookup(store: MessageStore):
+    assert dict(store) == dict(_ENTRIES)
+    assert store.source == ["test", 1]
+
+def test_membership(store: MessageStore):
+    assert 200 in store
+    assert 250 not in store
+    assert store.get(250, "missing") == "missing"
+
+    with pytest.raises(KeyError):
+        store[500]
+
+def test_interned(store: MessageStore):
+    assert store[300] is store[300]
@@ -0,0 +1,79 @@
+import pytest
+
+from erdb.loaders.columnar import ColumnarParam
+from erdb.table._common import FieldPredicate, filter_rows
+from erdb.typing.params import ParamRow, ParamDict
+from erdb.typing.enums import GoodsSortGroupID, GoodsType, ItemIDFlag
+
+
+_SORT_IDS = [0, 1, 2, 999998, 999999, 1000000, 9999998, 9999999, -1]
+
+_COMBINATIONS = [
+    (sort_id, sort_group, goods_type)
+    for sort_id in _SORT_IDS
+    for sort_group in [0, GoodsSortGroupID.GESTURES]
+    for goods_type in [GoodsType.NORMAL_ITEM, GoodsType.KEY_ITEM, GoodsType.SORCERY_1, GoodsType.CRAFTING_MATERIAL]
+]
+
+# IDs step over the bounds of the ID predicates, some rows are left unnamed
+_ROWS = [["Row ID", "Row Name", "sortId", "sortGroupId", "goodsType"]] + [
+    [str(i * 15000), "" if i % 5 == 0 else f"Row {i}", str(sort_id), str(int(sort_group)), goods_type.value]
+    for i, (sort_id, sort_group, goods_type) in enumerate(_COMBINATIONS)
+]
+
+@pytest.fixture(scope="module")
+def columnar() -> ParamDict:
+    param = ColumnarParam(ColumnarParam.compile(_ROWS, source=None))
+    row_ids, names = param.column("Row ID"), param.column("Row Name")
+    return {
+        row_ids[i].as_int: ParamRow(row_ids[i].as_int, ItemIDFlag.GOODS, str(names[i]), param, i)
+        for i in range(param.row_count)
+    }
+
+@pytest.fixture(scope="module")
+def separate() -> ParamDict:
+    # rows with storages of their own, which are filtered row by row
+    rows = [dict(zip(_ROWS[0], row)) for row in _ROWS[1:]]
+    return {int(row["Row ID"]): ParamRow.make(row, ItemIDFlag.GOODS) for row in rows}
+
+# predicates of the tables, each next to the lambda it replaced
+_PREDICATES = [
+    (FieldPredicate.int_range("sortId", 1, 999999), lambda row: 1 <= row["sortId"].as_int < 999999),
+    (FieldPredicate.int_range("sortId", 1, 9999999), lambda row: 1 <= row["sortId"].as_int < 9999999),
+    (FieldPredicate.int_range("Row ID", 1000, 999999), lambda row: 1000 <= row.index < 999999),
+    (FieldPredicate("Row ID", lambda v: v.as_int % 10000 == 0), lambda row: row.index % 10000 == 0),
+    (FieldPredicate("Row ID", lambda v: v.as_int >= 40000), lambda row: row.index >= 40000),
+    (FieldPredicate.name(lambda name: len(name) > 0), lambda row: len(row.name) > 0),
+    (FieldPredicate.equals("goodsType", GoodsType.KEY_ITEM), lambda row: row["goodsType"] == GoodsType.KEY_ITEM),
+    (FieldPredicate.one_of("goodsType", [GoodsType.NORMAL_ITEM, GoodsType.SORCERY_1]),
+     lambda row: row["goodsType"] in [GoodsType.NORMAL_ITEM, GoodsType.SORCERY_1]),
+    (FieldPredicate.int_one_of("sortGroupId", [GoodsSortGroupID.GESTURES]),
+     lambda row: row["sortGroupId"].as_int == GoodsSortGroupID.GESTURES),
+    (FieldPredicate.int_one_of("sortGroupId", [GoodsSortGroupID.GESTURES]).negate(),
+     lambda row: row["sortGroupId"].as_int != GoodsSortGroupID.GESTURES),
+]
+
+def _ids(rows: list[ParamRow]) -> list[int]:
+    return [row.index for row in rows]
+
+@pytest.mark.parametrize("params", ["columnar", "separate"])
+@pytest.mark.parametrize("predicate,replaced", _PREDICATES)
+def test_same_rows(request: pytest.FixtureRequest, params: str, predicate: FieldPredicate, replaced):
+    rows: ParamDict = request.getfixturevalue(params)
+    selected = _ids(filter_rows(rows.values(), [predicate]))
+
+    assert 0 < len(selected) < len(rows)
+    assert selected == _ids([row for row in rows.values() if replaced(row)])
+    assert selected == _ids([row for row in rows.values() if predicate(row)])
+
+def test_int_range_bounds(columnar: ParamDict):
+    sort_ids = {row["sortId"].as_int for row in filter_rows(columnar.values(), [FieldPredicate.int_range("sortId", 1, 999999)])}
+    assert sort_ids == {1, 2, 999998}
+
+@pytest.mark.parametrize("params", ["columnar", "separate"])
+def test_combined(request: pytest.FixtureRequest, params: str):
+    rows: ParamDict = request.getfixturevalue(params)
+    predicates = [predicate for predicate, _ in _PREDICATES[:2]] + [_PREDICATES[5][1], _PREDICATES[7][0]]
+    replaced = [replaced for _, replaced in _PREDICATES[:2]] + [_PREDICATES[5][1], _PREDICATES[7][1]]
+
+    assert _ids(filter_rows(rows.values(), predicates)) == _ids([row for row in rows.values() if all(p(row) for p in replaced)])
@@ -0,0 +1,41 @@
+import pickle
+import pytest
+
+from erdb.typing.effects import AttributeName, EffectModel, EffectType, SchemaEffect
+
+
+@pytest.fixture(scope="module")
+def effect() -> SchemaEffect:
+    return SchemaEffect(attribute=AttributeName.FIRE_ABSORPTION, effect_model=EffectModel.MULTIPLICATIVE,
+                        effect_type=EffectType.POSITIVE, value=1.1, conditions=["On Hit"], tick_interval=0.5)
+
+def test_immutable(effect: SchemaEffect):
+    assert effect.conditions == ("On Hit",)
+
+    with pytest.raises(AttributeError):
+        effect.value = 2.0 # type: ignore
+
+    assert effect.replace(value=2.0).value == 2.0
+    assert effect.value == 1.1
+
+def test_clone(effect: SchemaEffect):
+    clone = effect.clone(AttributeName.MAGIC_ABSORPTION)
+
+    assert clone.attribute == AttributeName.MAGIC_ABSORPTION
+    assert clone.conditions is effect.conditions
+    assert clone.get_values_hash() == effect.get_values_hash()
+    assert clone != effect and clone == effect.replace(attribute=AttributeName.MAGIC_ABSORPTION)
+    assert hash(clone) == hash(effect.replace(attribute=AttributeName.MAGIC_ABSORPTION))
+    assert pickle.loads(pickle.dumps(clone)) == clone
+
+def test_representations(effect: SchemaEffect):
+    assert effect.to_dict() == {
+        "attribute": AttributeName.FIRE_ABSORPTION,
+        "model": EffectModel.MULTIPLICATIVE,
+        "type": EffectType.POSITIVE,
+        "value": 1.1,
+        "conditions": ["On Hit"],
+        "tick_interval": 0.5,
+    }
+    assert effect.to_dict() is effect.to_dict()
+    assert str(effect) == "+1.1% Fire Absorption (under conditions ['On Hit']) on tick 0.5 s"
@@ -0,0 +1,46 @@
+import pytest
+
+from erdb.shop import Lookup
+from erdb.shop.shop_typing import Lineup, Material
+from erdb.table._retrievers import ShopRetriever
+from erdb.typing.params import ParamDict
+from erdb.typing.game_version import GameVersion
+
+
+# shops of the crafting materials and armor tables
+_SHOPS = [
+    ShopRetriever(None, None, 300000, 400000, recipe=True),
+    ShopRetriever(110000, 112000, 900100, 901000),
+]
+
+def _scan(shop_lineup: ParamDict, material_sets: ParamDict, material: Material) -> list[Lineup]:
+    # lookup of every query before lineups were indexed
+    lineups: list[Lineup] = []
+
+    for lineup_param in shop_lineup.values():
+        if mat_id := lineup_param["mtrlId"].get_int():
+            lineup = Lineup.from_params(lineup_param, material_sets[mat_id])
+            if material in lineup.materials.keys():
+                lineups.append(lineup)
+
+    return lineups
+
+@pytest.mark.parametrize("retriever", _SHOPS)
+def test_lineups_from_material(retriever: ShopRetriever):
+    version = GameVersion.from_string("1.10.0")
+    shop_lineup, material_sets = [r.get(version) for r in retriever._param_retrievers()]
+    lookup = Lookup(shop_lineup, material_sets)
+
+    materials = {material for lineups in lookup._by_material.values() for lineup in lineups for material in lineup.materials}
+    assert len(materials) > 0
+
+    for material in materials | {Material(1, Material.Category.GOOD)}:
+        assert lookup.get_lineups_from_material(material) == _scan(shop_lineup, material_sets, material)
+
+def test_lineups_are_copied():
+    version = GameVersion.from_string("1.10.0")
+    lookup = _SHOPS[0].get(version)
+    material = next(iter(lookup._by_material))
+
+    lookup.get_lineups_from_material(material).clear()
+    assert len(lookup.get_lineups_from_material(material)) > 0
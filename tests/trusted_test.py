@@ -0,0 +1,33 @@
+import pytest
+from pydantic import ValidationError
+
+from erdb.typing.models.effect import Effect
+from erdb.typing.models.armament import Armament, Scaling
+from erdb.typing.models.trusted import trusted_construction
+from erdb.typing.effects import AttributeName, EffectModel
+
+
+def test_conversions():
+    values = {"attribute": "Attack Power", "value": 2, "conditions": ["a", "b"]}
+
+    with trusted_construction([Effect]):
+        trusted = Effect(**values)
+
+    assert trusted == Effect(**values)
+    assert trusted.attribute is AttributeName.ATTACK_POWER
+    assert type(trusted.value) is float
+    assert trusted.model is EffectModel.MULTIPLICATIVE # default
+
+def test_constraints_skipped():
+    with pytest.raises(ValidationError):
+        Scaling(strength=-1.0)
+
+    # nested models are installed along with the armament
+    with trusted_construction([Armament]):
+        scaling = Scaling(strength=-1.0)
+
+    assert scaling.strength == -1.0
+
+def test_invalid_types():
+    with trusted_construction([Effect]), pytest.raises(ValidationError):
+        Effect(attribute="Attack Power", value="not a number")